@@ -7,6 +7,8 @@ import os
 import sys
 import re
 import json
+from copy import deepcopy
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any
 
@@ -21,6 +23,9 @@ from shared.utils.env import get_env
 # Module root
 _ROOT = Path(os.path.dirname(__file__)).absolute()
 
+# libyaml C parser when PyYAML was built with it, pure-Python SafeLoader otherwise
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 # Constants
 DAY_BEHIND = 7
 SCHEMA = "GoogleAnalytics"
@@ -34,10 +39,19 @@ def read_json(file: str) -> dict:
         return json.load(jsfile)
 
 
+@lru_cache(maxsize=16)
+def _parse_yaml(path: str, mtime_ns: int) -> dict:
+    """Parse a YAML file (cached per absolute path and modification time)."""
+    return yaml.load(Path(path).read_bytes(), Loader=_YAML_LOADER)
+
+
 def read_config(file: str) -> dict:
-    """Read YAML configuration file."""
-    with open(file, "r") as ymlfile:
-        return yaml.safe_load(ymlfile)
+    """Read YAML configuration file.
+
+    Each file is parsed once until it changes on disk; callers get their own copy.
+    """
+    path = os.path.abspath(file)
+    return deepcopy(_parse_yaml(path, os.stat(path).st_mtime_ns))
 
 
 def get_credentials() -> Dict[str, Any]:
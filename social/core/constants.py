@@ -132,6 +132,7 @@ class ProcessingStep(Enum):
     # Data cleaning
     MODIFY_NAME = "modify_name"
     REPLACE_NAN_WITH_ZERO = "replace_nan_with_zero"
+    FINALIZE_NULLS = "finalize_nulls"
 
 
 # Table dependencies (tables that must be processed before others)
@@ -7,7 +7,6 @@ data type management.
 
 import re
 import datetime
-from io import StringIO
 from typing import Optional, List, Dict, Any, NamedTuple
 import pandas as pd
 import numpy as np
@@ -21,6 +20,10 @@ from social.core.exceptions import DatabaseError as SocialDatabaseError
 from social.core.constants import DATABASE_SCHEMA, DATABASE_TEST_SUFFIX, PIPE_DELIMITER, ESCAPE_CHARS
 
 
+# Escapes for COPY values (backslash and pipe delimiter), applied in one pass
+_COPY_ESCAPE_TABLE = str.maketrans(ESCAPE_CHARS)
+
+
 class LoadStats(NamedTuple):
     """Statistics from a database load operation.
 
@@ -932,35 +935,30 @@ class VerticaDataSink:
         logger.debug(f"COPY SQL: {sql_query}")
         logger.debug(f"DataFrame columns for COPY: {list(df.columns)}")
 
-        # Build data buffer with proper escaping
-        buff = StringIO()
-        col_count = len(df.columns)
-        row_format = (PIPE_DELIMITER.join(["{}"] * col_count)) + "\n"
-
-        for row_values in df.values.tolist():
-            escaped_values = []
-            for val in row_values:
+        # Build data buffer with proper escaping, one column at a time:
+        # the null mask is computed for the whole frame and strings are escaped
+        # with a single translate() call instead of one replace() per character
+        values = df.values
+        nulls = pd.isna(values)
+        copy_columns = [
+            [
                 # Convert NaN/None to 'None' string (matches COPY null value)
-                if pd.isna(val) or val is None:
-                    escaped_values.append('None')
-                elif isinstance(val, str):
-                    # Escape special characters (backslash first, then pipe)
-                    escaped_val = val
-                    for char, replacement in ESCAPE_CHARS.items():
-                        escaped_val = escaped_val.replace(char, replacement)
-                    escaped_values.append(escaped_val)
-                else:
-                    escaped_values.append(val)
-
-            buff.write(row_format.format(*escaped_values))
+                "None" if is_null
+                else val.translate(_COPY_ESCAPE_TABLE) if isinstance(val, str)
+                else str(val)
+                for val, is_null in zip(values[:, j].tolist(), nulls[:, j].tolist())
+            ]
+            for j in range(values.shape[1])
+        ]
+        copy_data = "".join(PIPE_DELIMITER.join(row) + "\n" for row in zip(*copy_columns))
 
         # DEBUG: Log first row of data being sent
-        buff_preview = buff.getvalue()[:500] if buff.getvalue() else "EMPTY"
+        buff_preview = copy_data[:500] if copy_data else "EMPTY"
         logger.debug(f"First row of COPY data: {buff_preview}")
 
         # Execute COPY
         try:
-            cursor.copy(sql_query, buff.getvalue())
+            cursor.copy(sql_query, copy_data)
             cursor.execute("COMMIT")
 
             # DEBUG: Verify data was written with load_date
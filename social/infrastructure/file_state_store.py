@@ -0,0 +1,72 @@
+"""File-based extraction state store.
+
+This module persists, per table, the end date of the last successful
+extraction so incremental runs can fetch only the delta since then.
+"""
+
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+from loguru import logger
+
+
+class FileStateStore:
+    """Store of last pulled dates kept in a small JSON file.
+
+    The file maps state keys (e.g. table names) to ISO dates:
+    ``{"fb_ads_insight_actions": "2024-06-30"}``.
+    """
+
+    def __init__(self, state_file: Union[str, Path]):
+        """Initialize file-based state store.
+
+        Args:
+            state_file: Path to the JSON state file (created on first write)
+        """
+        self.state_file = Path(state_file)
+        self._state = self._load_state()
+
+        logger.info(f"FileStateStore initialized with {len(self._state)} entries from {self.state_file}")
+
+    def _load_state(self) -> Dict[str, str]:
+        """Load state from file, starting empty if missing or unreadable."""
+        if not self.state_file.exists():
+            return {}
+
+        try:
+            with open(self.state_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read state file {self.state_file}, starting empty: {e}")
+            return {}
+
+    def get_last_pulled(self, key: str) -> Optional[datetime]:
+        """Get the end date of the last successful extraction.
+
+        Args:
+            key: State key (e.g. table name)
+
+        Returns:
+            Last pulled date, or None if no state is recorded
+        """
+        value = self._state.get(key)
+        return datetime.fromisoformat(value) if value else None
+
+    def set_last_pulled(self, key: str, until: datetime) -> None:
+        """Record a successful extraction and persist the state file.
+
+        Args:
+            key: State key (e.g. table name)
+            until: End date of the extracted range
+        """
+        self._state[key] = until.date().isoformat()
+
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.state_file.with_suffix(".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(self._state, f, indent=2, sort_keys=True)
+        tmp_file.replace(self.state_file)
+
+        logger.debug(f"State updated: {key} -> {self._state[key]}")
@@ -29,6 +29,8 @@ __version__ = "1.0.0"
 __author__ = "Data Science Team"
 
 import os
+import sys
+from types import MappingProxyType
 
 from social import read_config
 from social.platforms.facebook.fields import *
@@ -48,18 +50,22 @@ accounts_company = {
     "2521097554864020": 20,
 }
 
-# Fields dispatcher
-dispatcher = {
-    "fields_account_info": fields_account_info,
-    "fields_custom_convers": fields_custom_convers,
-    "fields_ads_insight": fields_ads_insight,
-    "fields_ads_adset": fields_ads_adset,
-    "fields_ads_campaign": fields_ads_campaign,
-    "fields_ads_insight_actions": fields_ads_insight_actions,
-    "fields_ads_creative": fields_ads_creative,
-    "fields_ads_images": fields_ads_images,
-    "fields_ads_audience_adset": fields_ads_audience_adset,
-}
+# Fields dispatcher (read-only; tuples of interned field names, resolved once at import)
+dispatcher = MappingProxyType({
+    key: tuple(sys.intern(str(field)) for field in fields)
+    for key, fields in {
+        "fields_account_info": fields_account_info,
+        "fields_custom_convers": fields_custom_convers,
+        "fields_ads_insight": fields_ads_insight,
+        "fields_ads_insight_min": fields_ads_insight_min,
+        "fields_ads_adset": fields_ads_adset,
+        "fields_ads_campaign": fields_ads_campaign,
+        "fields_ads_insight_actions": fields_ads_insight_actions,
+        "fields_ads_creative": fields_ads_creative,
+        "fields_ads_images": fields_ads_images,
+        "fields_ads_audience_adset": fields_ads_audience_adset,
+    }.items()
+})
 
 # Load Facebook Ads configuration
 cfg_fb_ads = read_config(
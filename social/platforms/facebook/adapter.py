@@ -18,7 +18,7 @@ Architecture:
 """
 
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 
 import pandas as pd
 from loguru import logger
@@ -28,9 +28,11 @@ from social.core.protocols import DataSink, TokenProvider
 from social.platforms.facebook.constants import (
     DEFAULT_DATE_PRESET,
     FIELD_DEFINITIONS,
+    FIELD_PROFILE_SUFFIXES,
     MAX_DATE_RANGE_DAYS,
 )
 from social.platforms.facebook.http_client import FacebookHTTPClient
+from social.utils.commons import records_to_dataframe
 
 
 class FacebookAdapter:
@@ -44,7 +46,7 @@ class FacebookAdapter:
         token_provider: Provider for OAuth2 access tokens
         app_id: Facebook App ID
         app_secret: Facebook App Secret
-        ad_account_ids: List of Facebook Ad Account IDs
+        ad_account_ids: Tuple of "act_"-prefixed Facebook Ad Account IDs
         http_client: Facebook-specific HTTP client
         data_sink: Optional data sink for database queries
     """
@@ -54,7 +56,7 @@ class FacebookAdapter:
         token_provider: TokenProvider,
         app_id: str,
         app_secret: str,
-        ad_account_ids: List[str],
+        ad_account_ids: Sequence[str],
         data_sink: Optional[DataSink] = None,
     ):
         """Initialize Facebook adapter.
@@ -63,7 +65,8 @@ class FacebookAdapter:
             token_provider: Provider for authentication tokens
             app_id: Facebook App ID
             app_secret: Facebook App Secret
-            ad_account_ids: List of Facebook Ad Account IDs (e.g., ["act_123", "act_456"])
+            ad_account_ids: Facebook Ad Account IDs, with or without the "act_"
+                prefix (e.g., ["act_123", "456"])
             data_sink: Optional data sink for database queries
 
         Raises:
@@ -84,7 +87,7 @@ class FacebookAdapter:
         self.token_provider = token_provider
         self.app_id = app_id
         self.app_secret = app_secret
-        self.ad_account_ids = ad_account_ids
+        self.ad_account_ids = self._normalize_account_ids(ad_account_ids)
         self.data_sink = data_sink
 
         # Initialize HTTP client
@@ -94,7 +97,73 @@ class FacebookAdapter:
             app_secret=app_secret,
         )
 
-        logger.info(f"FacebookAdapter initialized with {len(ad_account_ids)} accounts")
+        logger.info(f"FacebookAdapter initialized with {len(self.ad_account_ids)} accounts")
+
+    @staticmethod
+    def _normalize_account_ids(ad_account_ids: Sequence[str]) -> Tuple[str, ...]:
+        """Validate account IDs and normalize them to the "act_" prefixed form.
+
+        Args:
+            ad_account_ids: Raw account IDs (numeric strings or "act_" prefixed)
+
+        Returns:
+            Immutable tuple of "act_" prefixed account IDs
+
+        Raises:
+            ConfigurationError: If any account ID is not a numeric Facebook ID
+        """
+        normalized = []
+        invalid = []
+
+        for raw_id in ad_account_ids:
+            account_id = str(raw_id).strip()
+            numeric_id = account_id[4:] if account_id.startswith("act_") else account_id
+
+            if not numeric_id.isdigit():
+                invalid.append(raw_id)
+                continue
+
+            normalized.append(f"act_{numeric_id}")
+
+        if invalid:
+            raise ConfigurationError(
+                "Invalid Facebook ad account IDs",
+                details={"invalid_ids": invalid},
+            )
+
+        return tuple(normalized)
+
+    @staticmethod
+    def _resolve_fields(
+        fields: Optional[Any],
+        default_key: str,
+        field_profile: Optional[str] = None,
+    ) -> Sequence[str]:
+        """Resolve the fields to request from a list, a fields key or a profile.
+
+        Args:
+            fields: Explicit list of fields, a FIELD_DEFINITIONS key, or None
+            default_key: FIELD_DEFINITIONS key used when fields is None or unknown
+            field_profile: "min" for the reduced list (if defined), "full" otherwise
+
+        Returns:
+            Sequence of field names to request
+
+        Raises:
+            ConfigurationError: If field_profile is not a known profile
+        """
+        if fields and not isinstance(fields, str):
+            return fields
+
+        suffix = FIELD_PROFILE_SUFFIXES.get(field_profile or "full")
+        if suffix is None:
+            raise ConfigurationError(
+                f"Unknown field profile: {field_profile}",
+                details={"available_profiles": list(FIELD_PROFILE_SUFFIXES)},
+            )
+
+        key = fields if fields in FIELD_DEFINITIONS else default_key
+        return FIELD_DEFINITIONS.get(f"{key}{suffix}") or FIELD_DEFINITIONS[key]
 
     def get_campaigns(self, account_id: str) -> List[Dict[str, Any]]:
         """Get campaigns for a specific account.
@@ -172,6 +241,7 @@ class FacebookAdapter:
         breakdowns: Optional[List[str]] = None,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
+        fields: Optional[Sequence[str]] = None,
     ) -> List[Dict[str, Any]]:
         """Get insights (performance metrics) for a specific account.
 
@@ -182,6 +252,7 @@ class FacebookAdapter:
             breakdowns: Optional list of breakdown dimensions (e.g., ["age", "gender"], ["publisher_platform"])
             start_date: Optional start date (for custom date ranges)
             end_date: Optional end date (for custom date ranges)
+            fields: Optional fields to retrieve (default: fields_ads_insight)
 
         Returns:
             List of insight dictionaries with performance metrics
@@ -192,16 +263,16 @@ class FacebookAdapter:
         logger.info(f"Fetching insights for account {account_id} (level: {level})")
 
         try:
-            fields = FIELD_DEFINITIONS.get("fields_ads_insight", [])
+            fields = fields or FIELD_DEFINITIONS.get("fields_ads_insight", [])
 
-            # Handle "maximum" date preset with chunking
+            # Handle "maximum" date preset with an async report job
             if date_range == "maximum" or (start_date and end_date):
                 # Calculate date range
                 if not start_date:
                     end_date = end_date or datetime.now()
                     start_date = end_date - timedelta(days=MAX_DATE_RANGE_DAYS)
 
-                logger.info(f"Using chunked date range: {start_date.date()} to {end_date.date()}")
+                logger.info(f"Using async report job: {start_date.date()} to {end_date.date()}")
 
                 base_params = {
                     "level": level,
@@ -210,13 +281,31 @@ class FacebookAdapter:
                 if breakdowns:
                     base_params["breakdowns"] = breakdowns
 
-                insights = self.http_client.get_insights_chunked(
-                    account_id=account_id,
-                    fields=fields,
-                    start_date=start_date,
-                    end_date=end_date,
-                    params=base_params,
-                )
+                try:
+                    insights = self.http_client.get_insights_async(
+                        account_id=account_id,
+                        fields=fields,
+                        params={
+                            **base_params,
+                            "time_range": {
+                                "since": start_date.strftime("%Y-%m-%d"),
+                                "until": end_date.strftime("%Y-%m-%d"),
+                            },
+                        },
+                    )
+                except APIError as e:
+                    # Only data volume failures are retried as one async job per date chunk;
+                    # auth, permission and throttling errors must surface
+                    if not self.http_client.is_data_volume_error(e):
+                        raise
+                    logger.warning(f"Async report job failed, falling back to date chunks: {e}")
+                    insights = self.http_client.get_insights_chunked(
+                        account_id=account_id,
+                        fields=fields,
+                        start_date=start_date,
+                        end_date=end_date,
+                        params=base_params,
+                    )
             else:
                 # Use date preset
                 date_preset = date_range or DEFAULT_DATE_PRESET
@@ -354,31 +443,7 @@ class FacebookAdapter:
             )
 
             # Extract audience targeting from ad sets
-            audience_data = []
-            for ad_set in ad_sets:
-                # Skip ad sets without required fields
-                adset_id = ad_set.get("id")
-                if not adset_id:
-                    logger.warning(f"Skipping ad set without id: {ad_set}")
-                    continue
-
-                targeting = ad_set.get("targeting", {})
-
-                # Extract custom audiences if present
-                custom_audiences = targeting.get("custom_audiences", [])
-
-                for audience in custom_audiences:
-                    audience_id = audience.get("id")
-                    if not audience_id:
-                        logger.warning(f"Skipping audience without id in adset {adset_id}")
-                        continue
-
-                    audience_data.append({
-                        "campaign_id": ad_set.get("campaign_id"),
-                        "adset_id": adset_id,
-                        "audience_id": audience_id,
-                        "name": audience.get("name"),
-                    })
+            audience_data = self._extract_audiences(ad_sets)
 
             logger.success(f"Retrieved {len(audience_data)} audience targeting records")
             return audience_data
@@ -390,6 +455,77 @@ class FacebookAdapter:
                 details={"account_id": account_id, "error": str(e)},
             )
 
+    @staticmethod
+    def _extract_audiences(ad_sets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Extract custom audience rows from ad sets with a 'targeting' field.
+
+        Args:
+            ad_sets: List of ad set dictionaries
+
+        Returns:
+            List of dictionaries with campaign_id, adset_id, audience_id and name
+        """
+        audience_data = []
+        for ad_set in ad_sets:
+            # Skip ad sets without required fields
+            adset_id = ad_set.get("id")
+            if not adset_id:
+                logger.warning(f"Skipping ad set without id: {ad_set}")
+                continue
+
+            targeting = ad_set.get("targeting", {})
+
+            # Extract custom audiences if present
+            custom_audiences = targeting.get("custom_audiences", [])
+
+            for audience in custom_audiences:
+                audience_id = audience.get("id")
+                if not audience_id:
+                    logger.warning(f"Skipping audience without id in adset {adset_id}")
+                    continue
+
+                audience_data.append({
+                    "campaign_id": ad_set.get("campaign_id"),
+                    "adset_id": adset_id,
+                    "audience_id": audience_id,
+                    "name": audience.get("name"),
+                })
+
+        return audience_data
+
+    def _get_edge_for_all_accounts(
+        self,
+        edge: str,
+        fields_key: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """Read one AdAccount edge for all configured accounts using batch requests.
+
+        Args:
+            edge: AdAccount edge method name (e.g., "get_campaigns")
+            fields_key: Key in FIELD_DEFINITIONS with the fields to retrieve
+            params: Optional request parameters
+
+        Returns:
+            Tuple of (rows from all accounts, failed account IDs)
+        """
+        try:
+            results, errors = self.http_client.get_edge_for_accounts(
+                edge=edge,
+                account_ids=self.ad_account_ids,
+                fields=FIELD_DEFINITIONS.get(fields_key, []),
+                params=params,
+            )
+        except Exception as e:
+            logger.error(f"Batch request '{edge}' failed for all accounts: {e}")
+            return [], list(self.ad_account_ids)
+
+        for account_id, error in errors.items():
+            logger.error(f"Failed to fetch '{edge}' for account {account_id}: {error}")
+
+        rows = [row for account_id in self.ad_account_ids for row in results.get(account_id, [])]
+        return rows, list(errors)
+
     def get_all_campaigns(
         self,
         date_preset: Optional[str] = None,
@@ -411,17 +547,11 @@ class FacebookAdapter:
         """
         logger.info(f"Fetching campaigns for {len(self.ad_account_ids)} accounts (date_preset={date_preset})")
 
-        all_campaigns = []
-        failed_accounts = []
-
-        for account_id in self.ad_account_ids:
-            try:
-                campaigns = self.get_campaigns(account_id)
-                all_campaigns.extend(campaigns)
-            except APIError as e:
-                logger.error(f"Failed to fetch campaigns for account {account_id}: {e}")
-                failed_accounts.append(account_id)
-                continue
+        all_campaigns, failed_accounts = self._get_edge_for_all_accounts(
+            "get_campaigns",
+            "fields_ads_campaign",
+            params={"date_preset": DEFAULT_DATE_PRESET},
+        )
 
         if failed_accounts:
             logger.warning(f"Failed accounts: {failed_accounts}")
@@ -452,17 +582,11 @@ class FacebookAdapter:
         """
         logger.info(f"Fetching ad sets for {len(self.ad_account_ids)} accounts (date_preset={date_preset})")
 
-        all_ad_sets = []
-        failed_accounts = []
-
-        for account_id in self.ad_account_ids:
-            try:
-                ad_sets = self.get_ad_sets(account_id)
-                all_ad_sets.extend(ad_sets)
-            except APIError as e:
-                logger.error(f"Failed to fetch ad sets for account {account_id}: {e}")
-                failed_accounts.append(account_id)
-                continue
+        all_ad_sets, failed_accounts = self._get_edge_for_all_accounts(
+            "get_ad_sets",
+            "fields_ads_adset",
+            params={"date_preset": DEFAULT_DATE_PRESET},
+        )
 
         if failed_accounts:
             logger.warning(f"Failed accounts: {failed_accounts}")
@@ -479,6 +603,9 @@ class FacebookAdapter:
         level: str = "ad",
         breakdowns: Optional[List[str]] = None,
         fields: Optional[List[str]] = None,
+        field_profile: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
         **kwargs
     ) -> List[Dict[str, Any]]:
         """Get insights for all configured ad accounts.
@@ -488,7 +615,10 @@ class FacebookAdapter:
             date_preset: Alternative param name for date_range (compatibility)
             level: Aggregation level
             breakdowns: Optional list of breakdown dimensions (e.g., ["age", "gender"])
-            fields: List of fields to retrieve - optional
+            fields: List of fields or FIELD_DEFINITIONS key - optional
+            field_profile: "min" for daily incremental runs, "full" for backfills - optional
+            start_date: Optional start date (custom range, overrides the date preset)
+            end_date: Optional end date (custom range)
             **kwargs: Additional parameters (ignored for compatibility)
 
         Returns:
@@ -497,30 +627,86 @@ class FacebookAdapter:
         Raises:
             APIError: If any account fails
         """
+        frames = [
+            batch
+            for batch in self.iter_all_insights(
+                date_range=date_range,
+                date_preset=date_preset,
+                level=level,
+                breakdowns=breakdowns,
+                fields=fields,
+                field_profile=field_profile,
+                start_date=start_date,
+                end_date=end_date,
+            )
+            if not batch.empty
+        ]
+        if not frames:
+            return pd.DataFrame()
+        return frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+
+    def iter_all_insights(
+        self,
+        date_range: Optional[str] = None,
+        date_preset: Optional[str] = None,
+        level: str = "ad",
+        breakdowns: Optional[List[str]] = None,
+        fields: Optional[List[str]] = None,
+        field_profile: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Yield insights for all configured ad accounts, one DataFrame per account.
+
+        Each account's records are converted as soon as they are fetched, so
+        only one account's raw API dictionaries are held in memory at a time.
+        Accounts that fail are logged and skipped.
+
+        Args:
+            date_range: Date preset (e.g., "last_7d", "maximum")
+            date_preset: Alternative param name for date_range (compatibility)
+            level: Aggregation level
+            breakdowns: Optional list of breakdown dimensions (e.g., ["age", "gender"])
+            fields: List of fields or FIELD_DEFINITIONS key - optional
+            field_profile: "min" for daily incremental runs, "full" for backfills - optional
+            start_date: Optional start date (custom range, overrides the date preset)
+            end_date: Optional end date (custom range)
+
+        Yields:
+            DataFrame with the insights of one account
+        """
         # Support both date_range and date_preset parameter names
         effective_date = date_preset or date_range
+        fields = self._resolve_fields(fields, "fields_ads_insight", field_profile)
 
         logger.info(f"Fetching insights for {len(self.ad_account_ids)} accounts (date_preset={effective_date}, breakdowns={breakdowns})")
 
-        all_insights = []
+        total_rows = 0
         failed_accounts = []
 
         for account_id in self.ad_account_ids:
             try:
-                insights = self.get_insights(account_id, effective_date, level, breakdowns=breakdowns)
-                all_insights.extend(insights)
+                insights = self.get_insights(
+                    account_id,
+                    effective_date,
+                    level,
+                    breakdowns=breakdowns,
+                    start_date=start_date,
+                    end_date=end_date,
+                    fields=fields,
+                )
             except APIError as e:
                 logger.error(f"Failed to fetch insights for account {account_id}: {e}")
                 failed_accounts.append(account_id)
                 continue
 
+            total_rows += len(insights)
+            yield records_to_dataframe(insights)
+
         if failed_accounts:
             logger.warning(f"Failed accounts: {failed_accounts}")
 
-        logger.success(f"Retrieved {len(all_insights)} total insights from {len(self.ad_account_ids) - len(failed_accounts)} accounts")
-
-        # Convert to DataFrame
-        return pd.DataFrame(all_insights)
+        logger.success(f"Retrieved {total_rows} total insights from {len(self.ad_account_ids) - len(failed_accounts)} accounts")
 
     def get_all_insights_with_actions(
         self,
@@ -541,6 +727,7 @@ class FacebookAdapter:
             List of insight dictionaries with actions from all accounts
         """
         logger.info(f"Fetching insights with actions (date_preset={date_preset})")
+        fields = self._resolve_fields(fields, "fields_ads_insight_actions")
         return self.get_all_insights(date_preset=date_preset, fields=fields, **kwargs)
 
     def get_all_custom_conversions(
@@ -561,17 +748,10 @@ class FacebookAdapter:
         """
         logger.info(f"Fetching custom conversions for {len(self.ad_account_ids)} accounts")
 
-        all_conversions = []
-        failed_accounts = []
-
-        for account_id in self.ad_account_ids:
-            try:
-                conversions = self.get_custom_conversions(account_id)
-                all_conversions.extend(conversions)
-            except APIError as e:
-                logger.error(f"Failed to fetch custom conversions for account {account_id}: {e}")
-                failed_accounts.append(account_id)
-                continue
+        all_conversions, failed_accounts = self._get_edge_for_all_accounts(
+            "get_custom_conversions",
+            "fields_custom_convers",
+        )
 
         if failed_accounts:
             logger.warning(f"Failed accounts: {failed_accounts}")
@@ -599,17 +779,12 @@ class FacebookAdapter:
         """
         logger.info(f"Fetching audience targeting for {len(self.ad_account_ids)} accounts")
 
-        all_audiences = []
-        failed_accounts = []
-
-        for account_id in self.ad_account_ids:
-            try:
-                audiences = self.get_audience_targeting(account_id)
-                all_audiences.extend(audiences)
-            except APIError as e:
-                logger.error(f"Failed to fetch audience targeting for account {account_id}: {e}")
-                failed_accounts.append(account_id)
-                continue
+        ad_sets, failed_accounts = self._get_edge_for_all_accounts(
+            "get_ad_sets",
+            "fields_ads_audience_adset",
+            params={"date_preset": DEFAULT_DATE_PRESET},
+        )
+        all_audiences = self._extract_audiences(ad_sets)
 
         if failed_accounts:
             logger.warning(f"Failed accounts: {failed_accounts}")
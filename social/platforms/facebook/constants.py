@@ -11,7 +11,9 @@ Constants:
 - FIELD_DEFINITIONS: Field lists for different API endpoints
 """
 
-from typing import Dict, List
+import sys
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple
 
 # Facebook Graph API Version
 API_VERSION = "v24.0"
@@ -54,117 +56,207 @@ COMPANY_ACCOUNT_MAP: Dict[str, int] = {
     # "act_987654321": 2,
 }
 
-# Import Facebook SDK field definitions for type-safety
-# This allows using both string fields and SDK Field objects
-try:
-    from facebook_business.adobjects.adaccount import AdAccount
-    from facebook_business.adobjects.adset import AdSet
-    from facebook_business.adobjects.adsinsights import AdsInsights
-    from facebook_business.adobjects.campaign import Campaign
-    from facebook_business.adobjects.customconversion import CustomConversion
-
-    # Facebook Ads API Field Definitions using SDK Field objects
-    # These provide type-safety and are compatible with the old implementation
-    FIELD_DEFINITIONS: Dict[str, List] = {
-        # Account fields
-        "fields_account_info": [
-            AdAccount.Field.id,
-            AdAccount.Field.account_id,
-            AdAccount.Field.name,
-            AdAccount.Field.account_status,
-            AdAccount.Field.age,
-            AdAccount.Field.currency,
-            AdAccount.Field.timezone_name,
-            AdAccount.Field.created_time,
-        ],
-        # Campaign fields
-        "fields_ads_campaign": [
-            Campaign.Field.id,
-            Campaign.Field.status,
-            Campaign.Field.configured_status,
-            Campaign.Field.effective_status,
-            Campaign.Field.created_time,
-            Campaign.Field.objective,
-        ],
-        # Ad Set fields
-        "fields_ads_adset": [
-            AdSet.Field.id,
-            AdSet.Field.campaign_id,
-            AdSet.Field.start_time,
-            AdSet.Field.end_time,
-            AdSet.Field.destination_type,
-        ],
-        # Ad Set targeting fields (for audience extraction)
-        "fields_ads_audience_adset": [
-            AdSet.Field.id,
-            AdSet.Field.campaign_id,
-            AdSet.Field.targeting,
-        ],
-        # Custom Conversion fields
-        "fields_custom_convers": [
-            CustomConversion.Field.id,
-            CustomConversion.Field.custom_event_type,
-            CustomConversion.Field.rule,
-        ],
-        # Insights fields (performance metrics)
-        "fields_ads_insight": [
-            AdsInsights.Field.account_id,
-            AdsInsights.Field.campaign_id,
-            AdsInsights.Field.adset_id,
-            AdsInsights.Field.ad_id,
-            AdsInsights.Field.ad_name,
-            AdsInsights.Field.spend,
-            AdsInsights.Field.impressions,
-            AdsInsights.Field.reach,
-            AdsInsights.Field.inline_link_clicks,
-            AdsInsights.Field.inline_link_click_ctr,
-            AdsInsights.Field.clicks,
-            AdsInsights.Field.ctr,
-            AdsInsights.Field.cpc,
-            AdsInsights.Field.cpm,
-        ],
-        # Insights actions fields (conversion metrics)
-        "fields_ads_insight_actions": [
-            AdsInsights.Field.ad_id,
-            AdsInsights.Field.actions,
-        ],
-        # Ad Creative fields - using string fallback as AdCreative fields vary
-        "fields_ads_creative": [
-            "id",
-            "name",
-            "title",
-            "body",
-            "object_story_id",
-            "object_type",
-            "image_url",
-            "video_id",
-            "thumbnail_url",
-            "effective_object_story_id",
-        ],
-    }
-except ImportError:
-    # Fallback to string-based fields if SDK not available
-    FIELD_DEFINITIONS: Dict[str, List[str]] = {
-        "fields_account_info": ["id", "account_id", "name", "account_status", "age", "currency", "timezone_name", "created_time"],
-        "fields_ads_campaign": ["id", "status", "configured_status", "effective_status", "created_time", "objective"],
-        "fields_ads_adset": ["id", "campaign_id", "start_time", "end_time", "destination_type"],
-        "fields_ads_audience_adset": ["id", "campaign_id", "targeting"],
-        "fields_custom_convers": ["id", "custom_event_type", "rule"],
-        "fields_ads_insight": ["account_id", "campaign_id", "adset_id", "ad_id", "ad_name", "spend", "impressions", "reach", "inline_link_clicks", "inline_link_click_ctr", "clicks", "ctr", "cpc", "cpm"],
-        "fields_ads_insight_actions": ["ad_id", "actions"],
-        "fields_ads_creative": ["id", "name", "title", "body", "object_story_id", "object_type", "image_url", "video_id", "thumbnail_url", "effective_object_story_id"],
-    }
+
+def _build_field_defs() -> Dict[str, List]:
+    """Build field lists per endpoint from the Facebook SDK Field objects.
+
+    Using SDK Field objects gives type-safety; plain strings are used when the
+    SDK is not installed. Kept in a function so the SDK imports and temporary
+    lists do not stay in the module namespace.
+    """
+    try:
+        from facebook_business.adobjects.adaccount import AdAccount
+        from facebook_business.adobjects.adset import AdSet
+        from facebook_business.adobjects.adsinsights import AdsInsights
+        from facebook_business.adobjects.campaign import Campaign
+        from facebook_business.adobjects.customconversion import CustomConversion
+
+        # Facebook Ads API Field Definitions using SDK Field objects
+        # These provide type-safety and are compatible with the old implementation
+        return {
+            # Account fields
+            "fields_account_info": [
+                AdAccount.Field.id,
+                AdAccount.Field.account_id,
+                AdAccount.Field.name,
+                AdAccount.Field.account_status,
+                AdAccount.Field.age,
+                AdAccount.Field.currency,
+                AdAccount.Field.timezone_name,
+                AdAccount.Field.created_time,
+            ],
+            # Campaign fields
+            "fields_ads_campaign": [
+                Campaign.Field.id,
+                Campaign.Field.status,
+                Campaign.Field.configured_status,
+                Campaign.Field.effective_status,
+                Campaign.Field.created_time,
+                Campaign.Field.objective,
+            ],
+            # Ad Set fields
+            "fields_ads_adset": [
+                AdSet.Field.id,
+                AdSet.Field.campaign_id,
+                AdSet.Field.start_time,
+                AdSet.Field.end_time,
+                AdSet.Field.destination_type,
+            ],
+            # Ad Set targeting fields (for audience extraction)
+            "fields_ads_audience_adset": [
+                AdSet.Field.id,
+                AdSet.Field.campaign_id,
+                AdSet.Field.targeting,
+            ],
+            # Custom Conversion fields
+            "fields_custom_convers": [
+                CustomConversion.Field.id,
+                CustomConversion.Field.custom_event_type,
+                CustomConversion.Field.rule,
+            ],
+            # Insights fields (performance metrics)
+            "fields_ads_insight": [
+                AdsInsights.Field.account_id,
+                AdsInsights.Field.campaign_id,
+                AdsInsights.Field.adset_id,
+                AdsInsights.Field.ad_id,
+                AdsInsights.Field.ad_name,
+                AdsInsights.Field.spend,
+                AdsInsights.Field.impressions,
+                AdsInsights.Field.reach,
+                AdsInsights.Field.inline_link_clicks,
+                AdsInsights.Field.inline_link_click_ctr,
+                AdsInsights.Field.clicks,
+                AdsInsights.Field.ctr,
+                AdsInsights.Field.cpc,
+                AdsInsights.Field.cpm,
+            ],
+            # Reduced insights profile (daily incremental runs)
+            "fields_ads_insight_min": [
+                AdsInsights.Field.account_id,
+                AdsInsights.Field.campaign_id,
+                AdsInsights.Field.ad_id,
+                AdsInsights.Field.spend,
+                AdsInsights.Field.impressions,
+                AdsInsights.Field.clicks,
+            ],
+            # Insights actions fields (conversion metrics)
+            "fields_ads_insight_actions": [
+                AdsInsights.Field.ad_id,
+                AdsInsights.Field.actions,
+            ],
+            # Ad Creative fields - using string fallback as AdCreative fields vary
+            "fields_ads_creative": [
+                "id",
+                "name",
+                "title",
+                "body",
+                "object_story_id",
+                "object_type",
+                "image_url",
+                "video_id",
+                "thumbnail_url",
+                "effective_object_story_id",
+            ],
+        }
+    except ImportError:
+        # Fallback to string-based fields if SDK not available
+        return {
+            "fields_account_info": ["id", "account_id", "name", "account_status", "age", "currency", "timezone_name", "created_time"],
+            "fields_ads_campaign": ["id", "status", "configured_status", "effective_status", "created_time", "objective"],
+            "fields_ads_adset": ["id", "campaign_id", "start_time", "end_time", "destination_type"],
+            "fields_ads_audience_adset": ["id", "campaign_id", "targeting"],
+            "fields_custom_convers": ["id", "custom_event_type", "rule"],
+            "fields_ads_insight": ["account_id", "campaign_id", "adset_id", "ad_id", "ad_name", "spend", "impressions", "reach", "inline_link_clicks", "inline_link_click_ctr", "clicks", "ctr", "cpc", "cpm"],
+            "fields_ads_insight_min": ["account_id", "campaign_id", "ad_id", "spend", "impressions", "clicks"],
+            "fields_ads_insight_actions": ["ad_id", "actions"],
+            "fields_ads_creative": ["id", "name", "title", "body", "object_story_id", "object_type", "image_url", "video_id", "thumbnail_url", "effective_object_story_id"],
+        }
+
+
+# In-memory dtypes for insight metrics (see FacebookProcessor.downcast_metrics):
+# counts fit in int32; money and ratios stay float64 because they are summed and
+# loaded without rounding (CTR needs 4+ decimals). float32 is opt-in per table.
+INSIGHT_INT32_COLUMNS = ("impressions", "clicks", "reach", "inline_link_clicks")
+INSIGHT_FLOAT64_COLUMNS = ("spend", "ctr", "cpc", "cpm", "cpp", "frequency", "inline_link_click_ctr")
+
+# Field profiles: "min" swaps a fields key for its "<key>_min" variant when defined,
+# "full" (default) keeps the complete list (periodic backfills)
+FIELD_PROFILE_SUFFIXES: Dict[str, str] = {
+    "min": "_min",
+    "full": "",
+}
+
+# Freeze field lists into tuples of interned strings once at import time,
+# so requests reuse them without per-call list copies or SDK attribute lookups.
+# The read-only mapping prevents callers from mutating the shared definitions.
+FIELD_DEFINITIONS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    key: tuple(sys.intern(str(field)) for field in fields)
+    for key, fields in _build_field_defs().items()
+})
 
 # Rate limiting configuration
 RATE_LIMIT_DELAY_SECONDS = 15  # Delay between API calls to avoid rate limits
 MAX_RETRIES = 3  # Maximum number of retries for failed requests
 BACKOFF_FACTOR = 2  # Exponential backoff factor (15s, 30s, 60s)
+# Error codes worth retrying: throttling (4, 17, 32, 613, 80000-80014) and
+# temporary server-side failures (1, 2). Anything else fails fast.
+RATE_LIMIT_ERROR_CODES = frozenset((4, 17, 32, 613, *range(80000, 80015)))
+RETRYABLE_ERROR_CODES = RATE_LIMIT_ERROR_CODES | {1, 2}
+RETRY_BASE_DELAY_SECONDS = 1  # Backoff base for network/server errors (rate limits use RATE_LIMIT_DELAY_SECONDS)
+MAX_BACKOFF_SECONDS = 300  # Upper bound of a single retry delay (before jitter)
+
+# Circuit breaker: after consecutive rate-limit errors on an account, calls are
+# refused for a cool-down instead of adding to Facebook's throttling debt
+CIRCUIT_BREAKER_THRESHOLD = 5  # Consecutive rate-limit errors that open the circuit
+CIRCUIT_BREAKER_COOLDOWN_SECONDS = RATE_LIMIT_DELAY_SECONDS * 4  # First cool-down (grows by BACKOFF_FACTOR)
+
+# Usage-driven throttling
+# Facebook reports quota consumption (0-100%) in the X-Business-Use-Case-Usage
+# and X-App-Usage response headers; we only pause when usage gets close to the cap
+USAGE_THROTTLE_THRESHOLD = 80  # Start throttling above this usage percentage
+USAGE_HEADERS = ("x-business-use-case-usage", "x-app-usage", "x-ad-account-usage")
 
 # Date chunking configuration
 # Facebook API has data size limits, so large date ranges need chunking
 DATE_CHUNK_DAYS = 120  # Split large date ranges into 120-day chunks (balance between speed and rate limits)
 MAX_DATE_RANGE_DAYS = 730  # Maximum 2 years of historical data
+INCREMENTAL_OVERLAP_DAYS = 3  # Re-fetch the last days of incremental runs (late attribution updates)
+
+# Async report jobs (AdReportRun) configuration
+# Large date ranges are requested as a single server-side job and polled until done
+ASYNC_JOB_MIN_POLL_SECONDS = 10  # First delay between job status polls
+ASYNC_JOB_MAX_POLL_SECONDS = 300  # Poll delay grows by BACKOFF_FACTOR up to this cap
+ASYNC_JOB_TIMEOUT_SECONDS = 3600  # Give up on a job after 1 hour
+ASYNC_JOB_COMPLETED = "Job Completed"
+ASYNC_JOB_FAILED_STATUSES = ("Job Failed", "Job Skipped")
+# Graph API error subcodes asking to reduce the amount of data requested
+# (1/99 "Please reduce the amount of data", 100/1487534 insights too large);
+# only these and failed/timed-out jobs fall back to date chunks
+DATA_VOLUME_ERROR_SUBCODES = frozenset((99, 1487534))
+
+# Graph API batch requests
+MAX_BATCH_SIZE = 50  # Maximum number of sub-requests per batch call
+
+# Access tokens are cached in-process per app, slightly below the ~60 day
+# lifetime of long-lived Facebook tokens
+TOKEN_CACHE_TTL_SECONDS = 55 * 24 * 3600
+INVALID_TOKEN_ERROR_CODE = 190  # Graph API error code for expired/invalid access tokens
+
+# Concurrency: chunk requests run on a thread pool; Facebook rate limits are
+# per account/app and tolerate a few requests in flight
+MAX_CONCURRENT_REQUESTS = 4  # Maximum in-flight requests per client
+MAX_CONCURRENT_TABLES = 4  # Tables extracted in parallel by the pipeline
+
+# Connection pooling for the SDK's requests session; the pool must cover every
+# worker thread or connections are discarded and re-handshaked
+HTTP_POOL_CONNECTIONS = 8  # Number of host pools kept
+HTTP_POOL_MAXSIZE = 32  # Keep-alive connections per host pool
 
 # Default pagination settings
 DEFAULT_PAGE_SIZE = 1000  # Default number of items per page
 MAX_PAGE_SIZE = 10000  # Maximum allowed page size
+
+# Targeting expansion: large ad set frames are split into blocks parsed on a thread pool
+TARGETING_PARALLEL_MIN_ROWS = 5000  # Below this, parse sequentially (pool overhead dominates)
+TARGETING_BLOCK_SIZE = 1000  # Ad sets per parallel task
@@ -42,6 +42,16 @@ fields_ads_insight = [
     AdsInsights.Field.cpm,
 ]
 
+# Reduced insight profile for daily incremental runs (fewer columns, smaller payloads)
+fields_ads_insight_min = [
+    AdsInsights.Field.account_id,
+    AdsInsights.Field.campaign_id,
+    AdsInsights.Field.ad_id,
+    AdsInsights.Field.spend,
+    AdsInsights.Field.impressions,
+    AdsInsights.Field.clicks,
+]
+
 fields_ads_insight_actions = [
     AdsInsights.Field.ad_id,
     AdsInsights.Field.actions,
@@ -8,7 +8,10 @@ Key Features:
 - Independent implementation (no base classes)
 - Facebook Business SDK integration
 - Exponential backoff for rate limiting
-- Date chunking for large date ranges
+- Usage-header driven throttling (X-Business-Use-Case-Usage, X-App-Usage)
+- Async report jobs (AdReportRun) for large date ranges
+- Date chunking as a fallback for large date ranges
+- Graph API batch requests for multi-account edge reads
 - Object-to-dict conversion utilities
 
 Architecture:
@@ -16,24 +19,154 @@ Architecture:
 - No inheritance, protocol-based contracts only
 """
 
+import json
+import random
+import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Union
+from functools import lru_cache
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
+from facebook_business.adobjects.abstractobject import AbstractObject
 from facebook_business.adobjects.adaccount import AdAccount
-from facebook_business.api import FacebookAdsApi
+from facebook_business.adobjects.adreportrun import AdReportRun
+from facebook_business.api import FacebookAdsApi, FacebookResponse
+from facebook_business.exceptions import FacebookRequestError
 from loguru import logger
+from requests import RequestException
+from requests.adapters import HTTPAdapter
 
 from social.core.exceptions import APIError, AuthenticationError
 from social.core.protocols import TokenProvider
 from social.platforms.facebook.constants import (
     API_VERSION,
+    ASYNC_JOB_COMPLETED,
+    ASYNC_JOB_FAILED_STATUSES,
+    ASYNC_JOB_MAX_POLL_SECONDS,
+    ASYNC_JOB_MIN_POLL_SECONDS,
+    ASYNC_JOB_TIMEOUT_SECONDS,
     BACKOFF_FACTOR,
+    CIRCUIT_BREAKER_COOLDOWN_SECONDS,
+    CIRCUIT_BREAKER_THRESHOLD,
+    DATA_VOLUME_ERROR_SUBCODES,
     DATE_CHUNK_DAYS,
+    HTTP_POOL_CONNECTIONS,
+    HTTP_POOL_MAXSIZE,
+    INVALID_TOKEN_ERROR_CODE,
+    MAX_BACKOFF_SECONDS,
+    MAX_BATCH_SIZE,
+    MAX_CONCURRENT_REQUESTS,
+    MAX_PAGE_SIZE,
     MAX_RETRIES,
     RATE_LIMIT_DELAY_SECONDS,
+    RATE_LIMIT_ERROR_CODES,
+    RETRY_BASE_DELAY_SECONDS,
+    RETRYABLE_ERROR_CODES,
+    TOKEN_CACHE_TTL_SECONDS,
+    USAGE_HEADERS,
+    USAGE_THROTTLE_THRESHOLD,
+)
+
+# Throttling markers in error text, for errors that no longer carry the SDK error code
+_RATE_LIMIT_RE = re.compile(
+    r"rate limit|request limit|too many (?:calls|requests)|\"code\":\s*(?:4|17|32|613)\b",
+    re.IGNORECASE,
 )
 
+@lru_cache(maxsize=64)
+def _normalize_field_names(fields: Tuple[Any, ...]) -> Tuple[str, ...]:
+    """Convert strings or SDK Field objects to field names (cached per field tuple)."""
+    return tuple(
+        field if isinstance(field, str) else getattr(field, "name", None) or str(field)
+        for field in fields
+    )
+
+
+_SCALAR_TYPES = (str, int, float, bool)
+
+
+def _export_value(value: Any) -> Any:
+    """Export a nested SDK value, with the semantics of AbstractObject.export_value.
+
+    None values are dropped from dictionaries and SDK objects are exported
+    recursively; scalars are returned as-is without a recursive call.
+    """
+    if isinstance(value, AbstractObject):
+        value = value._data
+    if isinstance(value, dict):
+        return {
+            k: v if type(v) in _SCALAR_TYPES else _export_value(v)
+            for k, v in value.items()
+            if v is not None
+        }
+    if isinstance(value, list):
+        return [v if type(v) in _SCALAR_TYPES else _export_value(v) for v in value]
+    return value
+
+
+def _export_record(obj: AbstractObject) -> Dict[str, Any]:
+    """Export an SDK object to a dictionary (same output as export_all_data).
+
+    Insight rows are mostly flat string fields, so scalars are copied in a
+    single comprehension and only nested values take the recursive path.
+    """
+    return {
+        k: v if type(v) in _SCALAR_TYPES else _export_value(v)
+        for k, v in obj._data.items()
+        if v is not None
+    }
+
+
+def _install_orjson_decoder() -> None:
+    """Parse SDK response bodies with orjson when it is installed.
+
+    FacebookResponse.json() decodes with the stdlib json module; orjson is
+    several times faster on large insights payloads. Bodies orjson rejects
+    still go through the stdlib parser. Patching is idempotent.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return
+
+    if getattr(FacebookResponse.json, "_orjson", False):
+        return
+
+    def response_json(self):
+        """Returns the response body -- in json if possible."""
+        try:
+            return orjson.loads(self._body)
+        except (TypeError, ValueError):
+            pass
+        try:
+            return json.loads(self._body)
+        except (TypeError, ValueError):
+            return self._body
+
+    response_json._orjson = True
+    FacebookResponse.json = response_json
+    logger.debug("Facebook SDK responses decoded with orjson")
+
+
+# In-process access token cache: app_id -> (token, monotonic expiry)
+_TOKEN_CACHE: Dict[str, Tuple[str, float]] = {}
+_TOKEN_CACHE_LOCK = threading.Lock()
+
+# Per-account circuit breakers: key -> {"state", "fail_count", "open_until", "opens"}
+_BREAKERS: Dict[str, Dict[str, Any]] = {}
+_BREAKERS_LOCK = threading.Lock()
+
 
 class FacebookHTTPClient:
     """HTTP client for Facebook Marketing API using Facebook Business SDK.
@@ -71,14 +204,27 @@ class FacebookHTTPClient:
         self.app_id = app_id
         self.app_secret = app_secret
 
+        # Highest quota usage percentage reported by the last API response
+        self._last_usage_pct = 0
+        # Seconds until throttling is lifted, as estimated by the last API response
+        self._regain_access_seconds = 0
+
+        # AdAccount objects by "act_" prefixed ID, reused across requests
+        self._accounts: Dict[str, AdAccount] = {}
+
+        # Caps concurrent requests issued from worker threads
+        self._request_slots = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+
         # Initialize Facebook Ads API
         try:
-            access_token = token_provider.get_access_token()
+            access_token = self._get_cached_token()
             self.api = FacebookAdsApi.init(
                 app_id=app_id,
                 app_secret=app_secret,
                 access_token=access_token,
             )
+            self._mount_connection_pool()
+            _install_orjson_decoder()
             logger.info(f"Facebook Ads API initialized (version: {API_VERSION})")
         except Exception as e:
             raise AuthenticationError(
@@ -86,11 +232,52 @@ class FacebookHTTPClient:
                 details={"app_id": app_id, "error": str(e)},
             )
 
+    def _mount_connection_pool(self) -> None:
+        """Mount a pooled HTTPS adapter on the SDK's requests session.
+
+        The default adapter keeps 10 connections per host; worker threads
+        beyond that open fresh TLS connections on every call. Retries are
+        disabled at the transport level since _execute_with_retry owns them.
+        """
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_CONNECTIONS,
+            pool_maxsize=max(HTTP_POOL_MAXSIZE, MAX_CONCURRENT_REQUESTS),
+            max_retries=0,
+        )
+        self.api._session.requests.mount("https://", adapter)
+
+    def _get_cached_token(self) -> str:
+        """Get the access token, calling the token provider only on cache miss.
+
+        Clients created for the same app share the token until
+        TOKEN_CACHE_TTL_SECONDS elapse or invalidate_token() is called.
+
+        Returns:
+            Facebook access token
+        """
+        with _TOKEN_CACHE_LOCK:
+            cached = _TOKEN_CACHE.get(self.app_id)
+            if cached and time.monotonic() < cached[1]:
+                return cached[0]
+
+            access_token = self.token_provider.get_access_token()
+            _TOKEN_CACHE[self.app_id] = (access_token, time.monotonic() + TOKEN_CACHE_TTL_SECONDS)
+            return access_token
+
+    def invalidate_token(self) -> None:
+        """Drop the cached access token (e.g., after an authentication failure)."""
+        with _TOKEN_CACHE_LOCK:
+            _TOKEN_CACHE.pop(self.app_id, None)
+        logger.debug(f"Access token cache invalidated for app {self.app_id}")
+
     def get_ad_account(self, account_id: str) -> AdAccount:
         """Get AdAccount object for a specific account.
 
+        AdAccount objects are cached per account, so repeated requests for
+        the same account reuse one instance.
+
         Args:
-            account_id: Ad Account ID (format: "act_123456789")
+            account_id: Ad Account ID (format: "act_123456789" or "123456789")
 
         Returns:
             AdAccount object from Facebook SDK
@@ -98,12 +285,16 @@ class FacebookHTTPClient:
         Raises:
             APIError: If account retrieval fails
         """
-        try:
-            # Ensure account ID has "act_" prefix
-            if not account_id.startswith("act_"):
-                account_id = f"act_{account_id}"
+        # Ensure account ID has "act_" prefix (before the cache lookup)
+        if not account_id.startswith("act_"):
+            account_id = f"act_{account_id}"
+
+        account = self._accounts.get(account_id)
+        if account is not None:
+            return account
 
-            return AdAccount(account_id, api=self.api)
+        try:
+            return self._accounts.setdefault(account_id, AdAccount(account_id, api=self.api))
         except Exception as e:
             raise APIError(
                 f"Failed to get AdAccount: {str(e)}",
@@ -129,7 +320,7 @@ class FacebookHTTPClient:
         Raises:
             APIError: If API request fails
         """
-        logger.debug(f"Fetching campaigns for account {account_id}")
+        logger.debug("Fetching campaigns for account {}", account_id)
 
         try:
             account = self.get_ad_account(account_id)
@@ -140,13 +331,14 @@ class FacebookHTTPClient:
 
             # Execute API request with retry logic
             campaigns = self._execute_with_retry(
-                lambda: account.get_campaigns(fields=normalized_fields, params=params)
+                lambda: account.get_campaigns(fields=normalized_fields, params=params),
+                account_id=account_id,
             )
 
             # Convert SDK objects to dictionaries
             campaign_list = self._convert_to_dict_list(campaigns)
 
-            logger.success(f"Retrieved {len(campaign_list)} campaigns")
+            logger.success("Retrieved {} campaigns", len(campaign_list))
             return campaign_list
 
         except Exception as e:
@@ -175,7 +367,7 @@ class FacebookHTTPClient:
         Raises:
             APIError: If API request fails
         """
-        logger.debug(f"Fetching ad sets for account {account_id}")
+        logger.debug("Fetching ad sets for account {}", account_id)
 
         try:
             account = self.get_ad_account(account_id)
@@ -186,13 +378,14 @@ class FacebookHTTPClient:
 
             # Execute API request with retry logic
             ad_sets = self._execute_with_retry(
-                lambda: account.get_ad_sets(fields=normalized_fields, params=params)
+                lambda: account.get_ad_sets(fields=normalized_fields, params=params),
+                account_id=account_id,
             )
 
             # Convert SDK objects to dictionaries
             ad_set_list = self._convert_to_dict_list(ad_sets)
 
-            logger.success(f"Retrieved {len(ad_set_list)} ad sets")
+            logger.success("Retrieved {} ad sets", len(ad_set_list))
             return ad_set_list
 
         except Exception as e:
@@ -221,7 +414,7 @@ class FacebookHTTPClient:
         Raises:
             APIError: If API request fails
         """
-        logger.debug(f"Fetching ads for account {account_id}")
+        logger.debug("Fetching ads for account {}", account_id)
 
         try:
             account = self.get_ad_account(account_id)
@@ -232,13 +425,14 @@ class FacebookHTTPClient:
 
             # Execute API request with retry logic
             ads = self._execute_with_retry(
-                lambda: account.get_ads(fields=normalized_fields, params=params)
+                lambda: account.get_ads(fields=normalized_fields, params=params),
+                account_id=account_id,
             )
 
             # Convert SDK objects to dictionaries
             ad_list = self._convert_to_dict_list(ads)
 
-            logger.success(f"Retrieved {len(ad_list)} ads")
+            logger.success("Retrieved {} ads", len(ad_list))
             return ad_list
 
         except Exception as e:
@@ -248,6 +442,64 @@ class FacebookHTTPClient:
                 details={"account_id": account_id, "error": str(e)},
             )
 
+    def get_insights_iter(
+        self,
+        account_id: str,
+        fields: List[str],
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream insights for a specific account, one dictionary at a time.
+
+        Unlike get_insights, records are not collected into a list: pages
+        are fetched by the SDK cursor as the generator is consumed, so the
+        result can be fed directly into a DataFrame or Parquet writer.
+
+        Args:
+            account_id: Ad Account ID
+            fields: List of fields to retrieve (strings or Field objects)
+            params: Optional parameters (time_range, level, breakdowns, etc.)
+
+        Yields:
+            Insight dictionaries with performance metrics
+
+        Raises:
+            APIError: If the initial API request fails
+        """
+        yield from self._iter_to_dicts(self._request_insights(account_id, fields, params))
+
+    def _request_insights(
+        self,
+        account_id: str,
+        fields: List[str],
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """Issue a synchronous insights request with the default parameters.
+
+        Args:
+            account_id: Ad Account ID
+            fields: List of fields to retrieve (strings or Field objects)
+            params: Optional parameters (time_range, level, breakdowns, etc.)
+
+        Returns:
+            SDK Cursor over AdsInsights objects (pages are fetched lazily)
+        """
+        account = self.get_ad_account(account_id)
+        params = self._insight_params(params)
+        normalized_fields = self._normalize_fields(fields)
+
+        return self._execute_with_retry(
+            lambda: account.get_insights(fields=normalized_fields, params=params),
+            account_id=account_id,
+        )
+
+    @staticmethod
+    def _insight_params(params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Copy insights request parameters, filling in the default level and attribution windows."""
+        params = dict(params or {})
+        params.setdefault("level", "ad")
+        params.setdefault("action_attribution_windows", ["7d_click", "1d_view"])
+        return params
+
     def get_insights(
         self,
         account_id: str,
@@ -267,39 +519,248 @@ class FacebookHTTPClient:
         Raises:
             APIError: If API request fails
         """
-        logger.debug(f"Fetching insights for account {account_id}")
+        logger.debug("Fetching insights for account {}", account_id)
+
+        try:
+            insight_list = list(self.get_insights_iter(account_id, fields, params))
+
+            logger.success("Retrieved {} insight records", len(insight_list))
+            return insight_list
+
+        except Exception as e:
+            logger.error(f"Failed to fetch insights: {e}")
+            raise APIError(
+                f"Failed to fetch insights for account {account_id}",
+                details={"account_id": account_id, "error": str(e)},
+            )
+
+    def get_insights_async(
+        self,
+        account_id: str,
+        fields: List[str],
+        params: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get insights through an asynchronous report job (AdReportRun).
+
+        The report is computed server-side, so a whole date range can be
+        requested in one job instead of many synchronous chunks. The job is
+        polled until completion and its results are read page by page.
+
+        Args:
+            account_id: Ad Account ID
+            fields: List of fields to retrieve (strings or Field objects)
+            params: Optional parameters (time_range, level, breakdowns, etc.)
+
+        Returns:
+            List of insight dictionaries with performance metrics
+
+        Raises:
+            APIError: If the job fails, times out or the API request fails
+        """
+        logger.info(f"Fetching insights for account {account_id} with an async report job")
 
         try:
             account = self.get_ad_account(account_id)
-            params = params or {}
+            params = self._insight_params(params)
 
             # Normalize fields
             normalized_fields = self._normalize_fields(fields)
 
-            # Set default parameters for insights
-            if "level" not in params:
-                params["level"] = "ad"
-            if "action_attribution_windows" not in params:
-                params["action_attribution_windows"] = ["7d_click", "1d_view"]
-
-            # Execute API request with retry logic
-            insights = self._execute_with_retry(
-                lambda: account.get_insights(fields=normalized_fields, params=params)
-            )
+            # Submit the report job
+            report_run = self._submit_async_insights(account, normalized_fields, params)
+            self._wait_for_report(report_run)
 
-            # Convert SDK objects to dictionaries
-            insight_list = self._convert_to_dict_list(insights)
+            insight_list = self._read_report(report_run)
 
-            logger.success(f"Retrieved {len(insight_list)} insight records")
+            logger.success(f"Retrieved {len(insight_list)} insight records from async report job")
             return insight_list
 
+        except APIError as e:
+            # Keep the details (error codes, job failure) so callers can decide on a fallback
+            logger.error(f"Failed to fetch insights with async report job: {e}")
+            raise APIError(
+                f"Failed to fetch insights for account {account_id} with async report job",
+                details={"account_id": account_id, "error": str(e), **e.details},
+            )
         except Exception as e:
-            logger.error(f"Failed to fetch insights: {e}")
+            logger.error(f"Failed to fetch insights with async report job: {e}")
             raise APIError(
-                f"Failed to fetch insights for account {account_id}",
-                details={"account_id": account_id, "error": str(e)},
+                f"Failed to fetch insights for account {account_id} with async report job",
+                details={
+                    "account_id": account_id,
+                    "error": str(e),
+                    "error_code": self._error_code(e),
+                    "error_subcode": self._error_subcode(e),
+                },
+            )
+
+    def _submit_async_insights(
+        self,
+        account: AdAccount,
+        fields: List[str],
+        params: Dict[str, Any],
+    ) -> AdReportRun:
+        """Submit an async insights report job.
+
+        Args:
+            account: AdAccount to report on
+            fields: Normalized field names
+            params: Report parameters (time_range, level, breakdowns, etc.)
+
+        Returns:
+            AdReportRun of the submitted job
+        """
+        return self._execute_with_retry(
+            lambda: account.get_insights(fields=fields, params=params, is_async=True),
+            account_id=account.get_id(),
+        )
+
+    def _read_report(self, report_run: AdReportRun) -> List[Dict[str, Any]]:
+        """Read the results of a completed async report job.
+
+        Args:
+            report_run: Completed AdReportRun
+
+        Returns:
+            List of insight dictionaries
+        """
+        def read() -> List[Dict[str, Any]]:
+            # Read results with the largest page size to minimize round trips
+            cursor = report_run.get_insights(params={"limit": MAX_PAGE_SIZE})
+            rows = self._convert_to_dict_list(cursor)
+            self._record_usage(cursor)
+            return rows
+
+        # The cursor loads later pages while it is iterated, so the whole read
+        # runs inside the retry: a failing page retries the read instead of escaping it
+        return self._execute_with_retry(read)
+
+    def _wait_for_report(
+        self,
+        report_run: AdReportRun,
+        timeout_seconds: int = ASYNC_JOB_TIMEOUT_SECONDS,
+    ) -> None:
+        """Poll an async report job until it completes.
+
+        Args:
+            report_run: AdReportRun returned by an async insights request
+            timeout_seconds: Maximum time to wait for the job
+
+        Raises:
+            APIError: If the job fails, is skipped or does not finish in time
+        """
+        failures = self._wait_for_reports([report_run], timeout_seconds, fail_fast=True)
+
+        if failures:
+            report_id, reason = next(iter(failures.items()))
+            raise APIError(
+                f"Async report job {report_id} did not complete: {reason}",
+                details={"report_run_id": report_id, "reason": reason, "job_failed": True},
             )
 
+    def _wait_for_reports(
+        self,
+        report_runs: Sequence[AdReportRun],
+        timeout_seconds: int = ASYNC_JOB_TIMEOUT_SECONDS,
+        fail_fast: bool = False,
+    ) -> Dict[str, str]:
+        """Poll async report jobs until all of them finish.
+
+        A job is done when its status is "Job Completed" and completion is
+        100%. The delay between polling rounds starts at
+        ASYNC_JOB_MIN_POLL_SECONDS and grows by BACKOFF_FACTOR up to
+        ASYNC_JOB_MAX_POLL_SECONDS.
+
+        A job whose status check fails (e.g. a non-retryable error or an
+        open circuit breaker) is recorded as failed, so the other jobs are
+        still waited for.
+
+        Args:
+            report_runs: AdReportRuns returned by async insights requests
+            timeout_seconds: Maximum time to wait for all jobs
+            fail_fast: Re-raise a failed status check instead of recording it
+
+        Returns:
+            Mapping of report run ID to failure reason for jobs that failed
+            or timed out (empty if all jobs completed)
+
+        Raises:
+            APIError: If a status check fails and fail_fast is set
+        """
+        pending = {report_run.get_id(): report_run for report_run in report_runs}
+        failures = {}
+        deadline = time.monotonic() + timeout_seconds
+        poll_seconds = ASYNC_JOB_MIN_POLL_SECONDS
+
+        # Status checks of a polling round run concurrently, so a round costs
+        # one request latency instead of one per pending job
+        with ThreadPoolExecutor(max_workers=max(1, min(len(pending), MAX_CONCURRENT_REQUESTS))) as executor:
+            while pending:
+                statuses = dict(zip(pending, executor.map(self._try_poll_report, pending.values())))
+
+                for report_id, result in statuses.items():
+                    if isinstance(result, APIError):
+                        if fail_fast:
+                            raise result
+                        failures[report_id] = f"status check failed: {result}"
+                        del pending[report_id]
+                        continue
+
+                    status, percent = result
+                    if status == ASYNC_JOB_COMPLETED and percent == 100:
+                        logger.debug("Report job {} completed", report_id)
+                        del pending[report_id]
+                    elif status in ASYNC_JOB_FAILED_STATUSES:
+                        failures[report_id] = f"ended with status '{status}'"
+                        del pending[report_id]
+                    else:
+                        logger.debug("Report job {}: {} ({}%)", report_id, status, percent)
+
+                if not pending:
+                    break
+
+                if time.monotonic() >= deadline:
+                    for report_id in pending:
+                        failures[report_id] = f"timed out after {timeout_seconds}s"
+                    break
+
+                logger.debug("{} report jobs running, polling again in {}s", len(pending), poll_seconds)
+                time.sleep(poll_seconds)
+                poll_seconds = min(poll_seconds * BACKOFF_FACTOR, ASYNC_JOB_MAX_POLL_SECONDS)
+
+        return failures
+
+    def _try_poll_report(self, report_run: AdReportRun) -> Union[Tuple[str, int], APIError]:
+        """Fetch the status of an async report job, returning the error on failure."""
+        try:
+            return self._poll_report(report_run)
+        except APIError as e:
+            return e
+
+    def _poll_report(self, report_run: AdReportRun) -> Tuple[str, int]:
+        """Fetch the status of an async report job.
+
+        Args:
+            report_run: AdReportRun to refresh
+
+        Returns:
+            Tuple of (async status, completion percentage)
+        """
+        with self._request_slots:
+            report_run = self._execute_with_retry(
+                lambda: report_run.api_get(
+                    fields=[
+                        AdReportRun.Field.async_status,
+                        AdReportRun.Field.async_percent_completion,
+                    ]
+                )
+            )
+
+        return (
+            report_run[AdReportRun.Field.async_status],
+            report_run[AdReportRun.Field.async_percent_completion],
+        )
+
     def get_insights_chunked(
         self,
         account_id: str,
@@ -312,7 +773,11 @@ class FacebookHTTPClient:
         """Get insights with date chunking for large date ranges.
 
         Facebook API has data size limits, so large date ranges need to be
-        split into smaller chunks.
+        split into smaller chunks. One async report job is submitted per chunk
+        up front, so the jobs run concurrently server-side; the results are
+        read once all jobs have finished. Failures are isolated per chunk: a
+        chunk whose job cannot be submitted, polled, completed or read is
+        logged and skipped, and the other chunks are still returned.
 
         Args:
             account_id: Ad Account ID
@@ -323,63 +788,64 @@ class FacebookHTTPClient:
             params: Optional base parameters
 
         Returns:
-            List of insight dictionaries from all chunks
-
-        Raises:
-            APIError: If any chunk request fails
+            List of insight dictionaries from the chunks that succeeded
         """
         logger.info(
-            f"Fetching insights with chunking: {start_date.date()} to {end_date.date()}"
+            f"Fetching insights with async report jobs per chunk: {start_date.date()} to {end_date.date()}"
         )
 
-        chunks = self._generate_date_chunks(start_date, end_date, chunk_days)
-        all_insights = []
+        account = self.get_ad_account(account_id)
+        fields = self._normalize_fields(fields)
+        # Defaults are chunk-invariant: only time_range differs between chunks
+        base_params = self._insight_params(params)
+        chunks = list(self._generate_date_chunks(start_date, end_date, chunk_days))
 
-        for idx, chunk in enumerate(chunks):
-            logger.info(f"Requesting chunk {idx + 1}/{len(chunks)}: {chunk['since']} to {chunk['until']}")
+        def submit(chunk: Dict[str, str]) -> Optional[AdReportRun]:
+            chunk_params = base_params | {"time_range": chunk}
 
-            # Build parameters for this chunk
-            chunk_params = params.copy() if params else {}
-            chunk_params["time_range"] = chunk
-            chunk_params.setdefault("level", "ad")
-            chunk_params.setdefault("action_attribution_windows", ["7d_click", "1d_view"])
+            try:
+                with self._request_slots:
+                    return self._submit_async_insights(account, fields, chunk_params)
+            except APIError as e:
+                logger.error(f"Failed to submit report job for chunk {chunk['since']}-{chunk['until']}: {e}")
+                return None
+
+        # Submit every chunk (in parallel) before polling any of them
+        with ThreadPoolExecutor(max_workers=max(1, min(len(chunks), MAX_CONCURRENT_REQUESTS))) as executor:
+            report_runs = [
+                (chunk, report_run)
+                for chunk, report_run in zip(chunks, executor.map(submit, chunks))
+                if report_run is not None
+            ]
+
+        failures = self._wait_for_reports([report_run for _, report_run in report_runs])
+
+        def read(item: Tuple[Dict[str, str], AdReportRun]) -> Optional[List[Dict[str, Any]]]:
+            chunk, report_run = item
+            reason = failures.get(report_run.get_id())
+            if reason:
+                logger.error(f"Report job for chunk {chunk['since']}-{chunk['until']} {reason}")
+                return None
 
-            # Retry logic for rate-limited chunks
-            retry_count = 0
-            chunk_success = False
+            try:
+                with self._request_slots:
+                    return self._read_report(report_run)
+            except APIError as e:
+                logger.error(f"Failed to read report job for chunk {chunk['since']}-{chunk['until']}: {e}")
+                return None
 
-            while retry_count < MAX_RETRIES and not chunk_success:
-                try:
-                    insights = self.get_insights(account_id, fields, chunk_params)
+        all_insights = []
+        succeeded = 0
+        with ThreadPoolExecutor(max_workers=max(1, min(len(report_runs), MAX_CONCURRENT_REQUESTS))) as executor:
+            for insights in executor.map(read, report_runs):
+                if insights is not None:
+                    succeeded += 1
                     all_insights.extend(insights)
-                    logger.info(f"Chunk received with {len(insights)} records")
-                    chunk_success = True
-
-                    # Add rate limit delay between chunks (not after the last one)
-                    if idx < len(chunks) - 1:
-                        logger.debug(f"Waiting {RATE_LIMIT_DELAY_SECONDS}s before next chunk...")
-                        time.sleep(RATE_LIMIT_DELAY_SECONDS)
-
-                except APIError as e:
-                    retry_count += 1
-
-                    # Check if it's a transient rate limit error
-                    error_msg = str(e)
-                    is_rate_limit = "rate limit" in error_msg.lower() or "too many" in error_msg.lower() or "error_subcode" in error_msg.lower()
-
-                    if is_rate_limit and retry_count < MAX_RETRIES:
-                        # Exponential backoff: 10s, 20s, 40s
-                        backoff_delay = RATE_LIMIT_DELAY_SECONDS * (BACKOFF_FACTOR ** (retry_count - 1))
-                        logger.warning(
-                            f"Rate limit hit for chunk {chunk['since']}-{chunk['until']}. "
-                            f"Retry {retry_count}/{MAX_RETRIES} after {backoff_delay}s backoff..."
-                        )
-                        time.sleep(backoff_delay)
-                    else:
-                        logger.error(f"Failed to fetch chunk {chunk['since']}-{chunk['until']} after {retry_count} retries: {e}")
-                        break  # Exit retry loop, continue to next chunk
 
-        logger.success(f"Retrieved {len(all_insights)} total insight records from {len(chunks)} chunks")
+        logger.success(
+            f"Retrieved {len(all_insights)} total insight records from "
+            f"{succeeded}/{len(chunks)} chunks"
+        )
         return all_insights
 
     def get_custom_conversions(
@@ -401,7 +867,7 @@ class FacebookHTTPClient:
         Raises:
             APIError: If API request fails
         """
-        logger.debug(f"Fetching custom conversions for account {account_id}")
+        logger.debug("Fetching custom conversions for account {}", account_id)
 
         try:
             account = self.get_ad_account(account_id)
@@ -412,13 +878,14 @@ class FacebookHTTPClient:
 
             # Execute API request with retry logic
             conversions = self._execute_with_retry(
-                lambda: account.get_custom_conversions(fields=normalized_fields, params=params)
+                lambda: account.get_custom_conversions(fields=normalized_fields, params=params),
+                account_id=account_id,
             )
 
             # Convert SDK objects to dictionaries
             conversion_list = self._convert_to_dict_list(conversions)
 
-            logger.success(f"Retrieved {len(conversion_list)} custom conversions")
+            logger.success("Retrieved {} custom conversions", len(conversion_list))
             return conversion_list
 
         except Exception as e:
@@ -428,73 +895,471 @@ class FacebookHTTPClient:
                 details={"account_id": account_id, "error": str(e)},
             )
 
-    def _execute_with_retry(self, func: callable, max_retries: int = MAX_RETRIES) -> Any:
+    def get_edge_for_accounts(
+        self,
+        edge: str,
+        account_ids: Sequence[str],
+        fields: List[str],
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Dict[str, List[Dict[str, Any]]], Dict[str, str]]:
+        """Read the same AdAccount edge for several accounts in batch calls.
+
+        Instead of one HTTP round trip per account, up to MAX_BATCH_SIZE
+        account requests are sent in a single Graph API batch call.
+
+        Args:
+            edge: AdAccount edge method name (e.g., "get_campaigns", "get_ad_sets")
+            account_ids: Ad Account IDs to query
+            fields: List of fields to retrieve (strings or Field objects)
+            params: Optional parameters shared by all requests
+
+        Returns:
+            Tuple of (results, errors) where results maps account ID to the list
+            of row dictionaries and errors maps failed account IDs to error messages
+        """
+        logger.debug("Batching '{}' for {} accounts", edge, len(account_ids))
+
+        normalized_fields = self._normalize_fields(fields)
+        requests = {
+            account_id: getattr(self.get_ad_account(account_id), edge)(
+                fields=normalized_fields,
+                params=dict(params or {}),
+                pending=True,
+            )
+            for account_id in account_ids
+        }
+
+        return self.execute_batch(requests)
+
+    def execute_batch(
+        self,
+        requests: Dict[str, Any],
+    ) -> Tuple[Dict[str, List[Dict[str, Any]]], Dict[str, str]]:
+        """Execute pending SDK requests through the Graph API batch endpoint.
+
+        Requests are split into batches of MAX_BATCH_SIZE. Sub-requests that
+        get no response are retried. Paginated results are followed until the
+        last page once the batches have run, so a failing page only marks its
+        own key as failed.
+
+        Args:
+            requests: Mapping of result key to pending FacebookRequest
+                (created with pending=True)
+
+        Returns:
+            Tuple of (results, errors) where results maps each key to the list
+            of row dictionaries and errors maps failed keys to error messages
+
+        Raises:
+            APIError: If a batch cannot be executed after all retries
+        """
+        bodies: Dict[str, Dict[str, Any]] = {}
+        errors: Dict[str, str] = {}
+        items = list(requests.items())
+
+        for start in range(0, len(items), MAX_BATCH_SIZE):
+            batch = self.api.new_batch()
+
+            for key, request in items[start:start + MAX_BATCH_SIZE]:
+
+                def on_success(response, key=key):
+                    # Only keep the first page here: paging inside the callback would
+                    # raise through batch.execute and fail every request of the batch
+                    bodies[key] = response.json()
+
+                def on_failure(response, key=key):
+                    error = response.error()
+                    errors[key] = error.api_error_message() or str(error)
+
+                batch.add_request(request, success=on_success, failure=on_failure)
+
+            # execute() returns a new batch with the calls that got no response
+            for attempt in range(MAX_RETRIES):
+                batch = self._execute_with_retry(batch.execute)
+                if batch is None:
+                    break
+                logger.warning(f"Retrying {len(batch)} batch sub-requests (attempt {attempt + 1}/{MAX_RETRIES})")
+            else:
+                raise APIError(
+                    "Batch sub-requests got no response after retries",
+                    details={"pending": len(batch), "attempts": MAX_RETRIES},
+                )
+
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        for key, body in bodies.items():
+            try:
+                results[key] = self._read_all_pages(body)
+            except Exception as e:
+                logger.error(f"Failed to read further pages for batch request {key}: {e}")
+                errors[key] = str(e)
+
+        logger.debug("Batch completed: {} succeeded, {} failed", len(results), len(errors))
+        return results, errors
+
+    def _read_all_pages(self, body: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Collect rows from a batch response body, following pagination.
+
+        Args:
+            body: Decoded JSON body of a batch sub-response
+
+        Returns:
+            List of row dictionaries from all pages
+        """
+        if "data" not in body:
+            # Node (single object) response
+            return [body]
+
+        rows = list(body["data"])
+        next_url = body.get("paging", {}).get("next")
+
+        while next_url:
+            page = self._execute_with_retry(
+                lambda url=next_url: self.api.call("GET", url)
+            ).json()
+            rows.extend(page.get("data", []))
+            next_url = page.get("paging", {}).get("next")
+
+        return rows
+
+    def _execute_with_retry(
+        self,
+        func: callable,
+        max_retries: int = MAX_RETRIES,
+        account_id: Optional[str] = None,
+    ) -> Any:
         """Execute API call with exponential backoff retry logic.
 
+        Calls go through the circuit breaker of the account (or of the app
+        when no account is given): once it is open, calls fail fast until the
+        cool-down has elapsed.
+
         Args:
             func: Function to execute (API call)
             max_retries: Maximum number of retry attempts
+            account_id: Ad Account ID the call is made for
 
         Returns:
             Result from successful API call
 
         Raises:
-            APIError: If all retries are exhausted
+            APIError: If all retries are exhausted, the error is not transient
+                or the circuit breaker is open
         """
+        breaker_key = self._breaker_key(account_id)
+
         for attempt in range(max_retries):
+            self._check_breaker(breaker_key)
+
             try:
                 result = func()
+                self._record_usage(result)
+                self._close_breaker(breaker_key)
 
-                # Add rate limit delay after successful call
-                time.sleep(RATE_LIMIT_DELAY_SECONDS)
+                # Pause only when the usage headers report we are close to the limit
+                self._throttle_on_usage()
 
                 return result
 
             except Exception as e:
+                # Sustained throttling opens the circuit: stop retrying right away
+                if self._is_rate_limit(e) and self._trip_breaker(breaker_key):
+                    raise APIError(
+                        f"API call failed, circuit breaker opened for {breaker_key}: {e}",
+                        details={"error": str(e), "circuit_open": True, "attempts": attempt + 1},
+                    )
+
+                if not self._is_retryable(e):
+                    # Expired/revoked token: make the next client fetch a fresh one
+                    if isinstance(e, FacebookRequestError) and e.api_error_code() == INVALID_TOKEN_ERROR_CODE:
+                        self.invalidate_token()
+
+                    # Deterministic failures (bad fields, permissions, bugs) fail fast
+                    raise APIError(
+                        f"API call failed: {e}",
+                        details={
+                            "error": str(e),
+                            "error_code": self._error_code(e),
+                            "error_subcode": self._error_subcode(e),
+                            "attempts": attempt + 1,
+                        },
+                    )
+
                 if attempt < max_retries - 1:
-                    # Calculate backoff delay
-                    delay = RATE_LIMIT_DELAY_SECONDS * (BACKOFF_FACTOR ** attempt)
+                    # Jittered exponential backoff, so parallel workers don't retry in lockstep
+                    base = RATE_LIMIT_DELAY_SECONDS if self._is_rate_limit(e) else RETRY_BASE_DELAY_SECONDS
+                    delay = min(MAX_BACKOFF_SECONDS, base * BACKOFF_FACTOR ** attempt) * random.uniform(0.5, 1.5)
                     logger.warning(
                         f"API call failed (attempt {attempt + 1}/{max_retries}), "
-                        f"retrying in {delay}s: {e}"
+                        f"retrying in {delay:.1f}s: {e}"
                     )
                     time.sleep(delay)
                 else:
                     # Last attempt failed
                     raise APIError(
                         f"API call failed after {max_retries} attempts",
-                        details={"error": str(e), "attempts": max_retries},
+                        details={
+                            "error": str(e),
+                            "error_code": self._error_code(e),
+                            "error_subcode": self._error_subcode(e),
+                            "attempts": max_retries,
+                        },
                     )
 
+    def _breaker_key(self, account_id: Optional[str]) -> str:
+        """Get the circuit breaker key of an account (or of the app)."""
+        if not account_id:
+            return f"app_{self.app_id}"
+        account_id = str(account_id)
+        return account_id if account_id.startswith("act_") else f"act_{account_id}"
+
+    @staticmethod
+    def _check_breaker(key: str) -> None:
+        """Refuse the call while the circuit breaker is open.
+
+        Once the cool-down has elapsed the breaker turns half-open and calls
+        go through again; the next result closes or re-opens it.
+
+        Args:
+            key: Circuit breaker key
+
+        Raises:
+            APIError: If the circuit breaker is open
+        """
+        with _BREAKERS_LOCK:
+            breaker = _BREAKERS.get(key)
+            if breaker is None or breaker["state"] == "closed":
+                return
+
+            remaining = breaker["open_until"] - time.monotonic()
+            if breaker["state"] == "open" and remaining > 0:
+                raise APIError(
+                    f"Circuit breaker open for {key}, refusing calls for {remaining:.0f}s",
+                    details={"breaker": key, "circuit_open": True, "retry_after": round(remaining)},
+                )
+
+            breaker["state"] = "half_open"
+
+    @staticmethod
+    def _trip_breaker(key: str) -> bool:
+        """Record a rate-limit error, opening the circuit at the threshold.
+
+        The cool-down starts at CIRCUIT_BREAKER_COOLDOWN_SECONDS and grows by
+        BACKOFF_FACTOR each time the breaker re-opens without recovering.
+
+        Args:
+            key: Circuit breaker key
+
+        Returns:
+            True if the circuit breaker is now open
+        """
+        with _BREAKERS_LOCK:
+            breaker = _BREAKERS.setdefault(
+                key, {"state": "closed", "fail_count": 0, "open_until": 0.0, "opens": 0}
+            )
+            breaker["fail_count"] += 1
+
+            if breaker["state"] != "half_open" and breaker["fail_count"] < CIRCUIT_BREAKER_THRESHOLD:
+                return False
+
+            cooldown = min(MAX_BACKOFF_SECONDS, CIRCUIT_BREAKER_COOLDOWN_SECONDS * BACKOFF_FACTOR ** breaker["opens"])
+            cooldown *= random.uniform(0.5, 1.5)
+            breaker.update(state="open", open_until=time.monotonic() + cooldown, opens=breaker["opens"] + 1)
+
+        logger.warning(f"Circuit breaker opened for {key} after repeated rate limits, cooling down {cooldown:.0f}s")
+        return True
+
+    @staticmethod
+    def _close_breaker(key: str) -> None:
+        """Reset the circuit breaker after a successful call."""
+        if key not in _BREAKERS:
+            return
+
+        with _BREAKERS_LOCK:
+            breaker = _BREAKERS.pop(key, None)
+
+        if breaker is not None and breaker["state"] != "closed":
+            logger.info(f"Circuit breaker closed for {key}")
+
+    @staticmethod
+    def _is_retryable(error: Exception) -> bool:
+        """Check whether a failed API call is worth retrying.
+
+        Network failures, throttling and 5xx responses are transient; invalid
+        parameters, permission errors and local exceptions are not.
+
+        Args:
+            error: Exception raised by the API call
+
+        Returns:
+            True if the call should be retried
+        """
+        if isinstance(error, FacebookRequestError):
+            return (
+                error.api_transient_error()
+                or error.api_error_code() in RETRYABLE_ERROR_CODES
+                or (error.http_status() or 0) >= 500
+            )
+
+        return isinstance(error, (RequestException, ConnectionError, TimeoutError))
+
+    @staticmethod
+    def _is_rate_limit(error: Exception) -> bool:
+        """Check whether a failed API call was throttled by Facebook.
+
+        Args:
+            error: Exception raised by the API call
+
+        The SDK error code is checked first; errors already wrapped in an
+        APIError fall back to the code recorded in their details, then to
+        matching throttling markers in the message. Other exception types
+        (local bugs, KeyError, ValueError, ...) are never throttling, even if
+        their message happens to match.
+
+        Returns:
+            True for Graph API throttling errors
+        """
+        error_code = FacebookHTTPClient._error_code(error)
+        if error_code is None and isinstance(error, APIError):
+            error_code = error.details.get("error_code")
+        if error_code is not None:
+            return error_code in RATE_LIMIT_ERROR_CODES
+
+        if not isinstance(error, (FacebookRequestError, APIError)):
+            return False
+        return bool(_RATE_LIMIT_RE.search(str(error)))
+
+    @staticmethod
+    def _error_code(error: Exception) -> Optional[int]:
+        """Get the Graph API error code of a failed call, if any."""
+        return error.api_error_code() if isinstance(error, FacebookRequestError) else None
+
+    @staticmethod
+    def _error_subcode(error: Exception) -> Optional[int]:
+        """Get the Graph API error subcode of a failed call, if any."""
+        return error.api_error_subcode() if isinstance(error, FacebookRequestError) else None
+
+    @staticmethod
+    def is_data_volume_error(error: APIError) -> bool:
+        """Check whether an insights request failed because of its data volume.
+
+        Async report jobs that failed, were skipped or timed out count as
+        data volume failures, as do the "reduce the amount of data" error
+        subcodes. Throttling, permission and circuit breaker errors do not:
+        retrying them in smaller chunks only adds load or hides the failure.
+
+        Args:
+            error: APIError raised by an insights request
+
+        Returns:
+            True if the request is worth retrying in smaller date chunks
+        """
+        if error.details.get("circuit_open"):
+            return False
+        return bool(error.details.get("job_failed")) or (
+            error.details.get("error_subcode") in DATA_VOLUME_ERROR_SUBCODES
+        )
+
+    def _record_usage(self, response: Any) -> None:
+        """Record quota usage reported in the response headers.
+
+        Facebook returns JSON usage headers whose values are percentages of the
+        allowed quota (call_count, total_cputime, total_time). The highest value
+        across all headers is kept as the current usage, along with the
+        estimated_time_to_regain_access (minutes) of throttled business use cases.
+
+        Args:
+            response: SDK Cursor or FacebookResponse exposing headers()
+        """
+        headers_getter = getattr(response, "headers", None)
+        if not callable(headers_getter):
+            return
+
+        headers = headers_getter() or {}
+        usage_pct = 0
+        regain_minutes = 0
+
+        for header_name in USAGE_HEADERS:
+            raw_value = headers.get(header_name)
+            if not raw_value:
+                continue
+            try:
+                usage = json.loads(raw_value)
+            except (TypeError, ValueError):
+                continue
+
+            # X-Business-Use-Case-Usage maps business IDs to lists of usage dicts
+            if isinstance(usage, dict) and all(isinstance(v, list) for v in usage.values()):
+                entries = [entry for values in usage.values() for entry in values]
+            else:
+                entries = [usage]
+
+            for entry in entries:
+                if not isinstance(entry, dict):
+                    continue
+                for key in ("call_count", "total_cputime", "total_time", "acc_id_util_pct"):
+                    value = entry.get(key)
+                    if isinstance(value, (int, float)):
+                        usage_pct = max(usage_pct, value)
+
+                value = entry.get("estimated_time_to_regain_access")
+                if isinstance(value, (int, float)):
+                    regain_minutes = max(regain_minutes, value)
+
+        self._last_usage_pct = usage_pct
+        self._regain_access_seconds = regain_minutes * 60
+
+    def _throttle_on_usage(self) -> None:
+        """Sleep only when the last reported usage is close to the quota.
+
+        The delay grows quadratically with usage above the threshold, up to
+        RATE_LIMIT_DELAY_SECONDS * BACKOFF_FACTOR when usage reaches 100%.
+        When Facebook reports a time to regain access, that wait (capped at
+        MAX_BACKOFF_SECONDS) is used instead.
+        """
+        if self._regain_access_seconds > 0:
+            delay = min(self._regain_access_seconds, MAX_BACKOFF_SECONDS)
+            logger.warning(f"API access throttled, waiting {delay:.0f}s before next request...")
+            time.sleep(delay)
+            return
+
+        usage_pct = self._last_usage_pct
+        if usage_pct < USAGE_THROTTLE_THRESHOLD:
+            return
+
+        excess = (min(usage_pct, 100) - USAGE_THROTTLE_THRESHOLD) / (100 - USAGE_THROTTLE_THRESHOLD)
+        delay = RATE_LIMIT_DELAY_SECONDS * BACKOFF_FACTOR * max(excess, 0.1) ** 2
+        logger.debug("API usage at {}%, waiting {:.1f}s before next request...", usage_pct, delay)
+        time.sleep(delay)
+
     def _generate_date_chunks(
         self,
         start_date: datetime,
         end_date: datetime,
         chunk_days: int = DATE_CHUNK_DAYS,
-    ) -> List[Dict[str, str]]:
+    ) -> Iterator[Dict[str, str]]:
         """Generate date chunks for large date ranges.
 
+        Chunks are yielded lazily, so the first request can be sent before
+        the remaining chunks are formatted.
+
         Args:
             start_date: Start date
             end_date: End date
             chunk_days: Days per chunk
 
-        Returns:
-            List of time_range dictionaries with 'since' and 'until' keys
+        Yields:
+            time_range dictionaries with 'since' and 'until' keys
         """
-        chunks = []
-        current_date = start_date
-
-        while current_date < end_date:
-            chunk_end = min(current_date + timedelta(days=chunk_days), end_date)
-            chunks.append({
-                "since": current_date.strftime("%Y-%m-%d"),
-                "until": chunk_end.strftime("%Y-%m-%d"),
-            })
-            current_date = chunk_end + timedelta(days=1)
+        # Each chunk covers chunk_days + 1 calendar days (both bounds inclusive)
+        span = timedelta(days=chunk_days)
+        step = timedelta(days=chunk_days + 1)
+        current = start_date
 
-        logger.debug(f"Generated {len(chunks)} date chunks")
-        return chunks
+        while current < end_date:
+            chunk_end = min(current + span, end_date)
+            # date.isoformat() gives YYYY-MM-DD without parsing a format string
+            yield {"since": current.date().isoformat(), "until": chunk_end.date().isoformat()}
+            current += step
 
     def _normalize_fields(self, fields: List[Any]) -> List[str]:
         """Normalize field list to strings.
@@ -508,17 +1373,17 @@ class FacebookHTTPClient:
         Returns:
             List of field names as strings
         """
-        normalized = []
-        for field in fields:
-            if isinstance(field, str):
-                normalized.append(field)
-            elif hasattr(field, "name"):
-                # SDK Field object with name attribute
-                normalized.append(field.name)
-            else:
-                # Try to convert to string
-                normalized.append(str(field))
-        return normalized
+        fields = tuple(fields)
+
+        # Fast path: the frozen FIELD_DEFINITIONS tuples already hold plain strings
+        if all(type(field) is str for field in fields):
+            return list(fields)
+
+        try:
+            return list(_normalize_field_names(fields))
+        except TypeError:
+            # Unhashable field objects cannot be cached
+            return list(_normalize_field_names.__wrapped__(fields))
 
     def _convert_to_dict_list(self, sdk_objects: Any) -> List[Dict[str, Any]]:
         """Convert Facebook SDK objects to list of dictionaries.
@@ -532,31 +1397,61 @@ class FacebookHTTPClient:
         Returns:
             List of dictionaries with exported data
         """
-        if not sdk_objects:
-            return []
-
-        result = []
-
-        # Handle different response types
-        if hasattr(sdk_objects, "__iter__"):
-            for obj in sdk_objects:
-                if hasattr(obj, "export_all_data"):
-                    # SDK object with export method
-                    result.append(obj.export_all_data())
-                elif isinstance(obj, dict):
-                    # Already a dictionary
-                    result.append(obj)
-                else:
-                    # Try to convert to dict
-                    result.append(dict(obj))
-        elif hasattr(sdk_objects, "export_all_data"):
-            # Single SDK object
-            result.append(sdk_objects.export_all_data())
-        elif isinstance(sdk_objects, dict):
-            # Single dictionary
-            result.append(sdk_objects)
+        # Lists of dictionaries (e.g. batch results) need no conversion at all
+        if isinstance(sdk_objects, list) and (not sdk_objects or isinstance(sdk_objects[0], dict)):
+            return sdk_objects.copy()
+
+        return list(self._iter_to_dicts(sdk_objects))
+
+    @staticmethod
+    def _iter_to_dicts(sdk_objects: Any) -> Iterator[Dict[str, Any]]:
+        """Lazily convert Facebook SDK objects to dictionaries.
+
+        The conversion is chosen once from the first element (SDK cursors are
+        homogeneous) instead of being checked for every object.
 
-        return result
+        Args:
+            sdk_objects: Cursor, iterable of SDK objects/dicts, or a single object
+
+        Yields:
+            Dictionaries with exported data
+        """
+        if not sdk_objects:
+            return
+
+        # Single SDK object or dictionary (both are iterable, so check them first)
+        if isinstance(sdk_objects, AbstractObject):
+            yield _export_record(sdk_objects)
+            return
+        if hasattr(sdk_objects, "export_all_data"):
+            yield sdk_objects.export_all_data()
+            return
+        if isinstance(sdk_objects, dict):
+            yield sdk_objects
+            return
+
+        iterator = iter(sdk_objects)
+        first = next(iterator, None)
+        if first is None:
+            return
+
+        if isinstance(first, AbstractObject):
+            # SDK objects: export their parsed data directly
+            convert = _export_record
+        elif hasattr(first, "export_all_data"):
+            # Other objects with export method
+            convert = type(first).export_all_data
+        elif isinstance(first, dict):
+            # Already dictionaries
+            yield first
+            yield from iterator
+            return
+        else:
+            # Try to convert to dict
+            convert = dict
+
+        yield convert(first)
+        yield from map(convert, iterator)
 
     def close(self) -> None:
         """Close the HTTP client and release resources.
@@ -564,4 +1459,5 @@ class FacebookHTTPClient:
         Note: Facebook SDK doesn't require explicit cleanup,
         but this method is provided for consistency with other clients.
         """
+        self._accounts.clear()
         logger.debug("FacebookHTTPClient closed")
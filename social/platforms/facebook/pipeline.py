@@ -20,9 +20,13 @@ Architecture:
 - Container-ready (no browser interactions)
 """
 
+import copy
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import pandas as pd
 import yaml
@@ -30,7 +34,9 @@ from loguru import logger
 
 from social.core.exceptions import ConfigurationError, PipelineError
 from social.core.protocols import DataSink, TokenProvider
+from social.infrastructure.file_state_store import FileStateStore
 from social.platforms.facebook.adapter import FacebookAdapter
+from social.platforms.facebook.constants import INCREMENTAL_OVERLAP_DAYS, MAX_CONCURRENT_TABLES
 from social.platforms.facebook.processor import FacebookProcessor
 
 
@@ -45,6 +51,7 @@ class FacebookPipeline:
         app_id: str,
         app_secret: str,
         data_sink: Optional[DataSink] = None,
+        state_store: Optional[FileStateStore] = None,
     ):
         """Initialize the Facebook Ads pipeline."""
         if config is None:
@@ -53,6 +60,8 @@ class FacebookPipeline:
         self.config = config
         self.token_provider = token_provider
         self.data_sink = data_sink
+        self._sink_call = self._resolve_sink_call(data_sink)
+        self.state_store = state_store
         self.ad_account_ids = ad_account_ids
 
         # Initialize adapter
@@ -69,6 +78,21 @@ class FacebookPipeline:
             if key != "platform" and key.startswith("fb_ads_")
         ]
 
+        # Tables run on a thread pool; the sink connection and state file are shared
+        self._load_lock = threading.Lock()
+
+        # Processing plans are resolved once per table and reused on every run
+        self._plans = {
+            table_name: self._compile_plan(table_name, config[table_name].get("processing"))
+            for table_name in self.table_names
+        }
+
+        # Extraction calls are bound once per table; runs only supply the date range
+        self._extractors = {
+            table_name: self._resolve_extractor(table_name, config[table_name])
+            for table_name in self.table_names
+        }
+
         logger.info(f"FacebookPipeline initialized with {len(self.table_names)} tables and {len(ad_account_ids)} accounts")
 
     def run(
@@ -91,6 +115,11 @@ class FacebookPipeline:
             if not table_config:
                 raise ConfigurationError(f"Table '{table_name}' not found in configuration")
 
+            # Incremental tables only fetch the delta since the last successful run
+            incremental = table_config.get("incremental") and self.state_store is not None
+            if incremental and start_date is None:
+                start_date, end_date = self._incremental_range(table_name, table_config)
+
             # Extract
             df = self._extract_table(table_name, table_config, start_date, end_date)
             if df.empty:
@@ -126,7 +155,11 @@ class FacebookPipeline:
             # Load
             stats = None
             if load_to_sink and self.data_sink:
-                stats = self._load_to_sink(processed_df, table_name)
+                with self._load_lock:
+                    stats = self._load_to_sink(processed_df, table_name)
+
+                    if incremental:
+                        self.state_store.set_last_pulled(table_name, end_date or datetime.now())
 
             duration = (datetime.now() - start_time).total_seconds()
             logger.success(f"Pipeline completed for {table_name} in {duration:.2f}s")
@@ -149,14 +182,17 @@ class FacebookPipeline:
         results_stats = {}
         errors = {}
 
+        # Extraction is I/O bound: overlap the API calls of different tables
+        outcomes = self._run_tables(self.table_names, load_to_sink=True)
+
         for table_name in self.table_names:
-            try:
-                df, stats = self.run(table_name, load_to_sink=True)
-                results_stats[table_name] = stats
-            except Exception as e:
-                error_msg = str(e)
+            outcome = outcomes[table_name]
+            if isinstance(outcome, Exception):
+                error_msg = str(outcome)
                 logger.error(f"Failed to process table {table_name}: {error_msg}")
                 errors[table_name] = error_msg
+            else:
+                results_stats[table_name] = outcome[1]
 
         successful = len([name for name in results_stats if name not in errors])
         total_written = sum(stats.get("rows_written", 0) for stats in results_stats.values())
@@ -168,6 +204,57 @@ class FacebookPipeline:
         )
         return results_stats, errors
 
+    def _run_tables(self, table_names: List[str], load_to_sink: bool) -> Dict[str, Any]:
+        """Run the pipeline for several tables on a thread pool.
+
+        Args:
+            table_names: Tables to run
+            load_to_sink: Whether to load each table to the data sink
+
+        Returns:
+            Dict mapping table_name to the run() result, or to the exception it raised
+        """
+        def run_table(table_name: str) -> Any:
+            try:
+                return self.run(table_name, load_to_sink=load_to_sink)
+            except Exception as e:
+                return e
+
+        if not table_names:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(len(table_names), MAX_CONCURRENT_TABLES)) as executor:
+            return dict(zip(table_names, executor.map(run_table, table_names)))
+
+    def _incremental_range(
+        self,
+        table_name: str,
+        table_config: Dict[str, Any],
+    ) -> tuple[Optional[datetime], Optional[datetime]]:
+        """Compute the date range of an incremental run from the stored state.
+
+        The range restarts a few days before the last pulled date so that late
+        attribution updates are captured; the load upserts the overlap.
+
+        Returns:
+            Tuple of (start_date, end_date), or (None, None) when no state exists
+            yet and the configured date_preset should be used
+        """
+        last_pulled = self.state_store.get_last_pulled(table_name)
+        if last_pulled is None:
+            logger.info(f"No incremental state for {table_name}, using configured date_preset")
+            return None, None
+
+        incremental = table_config["incremental"]
+        overlap_days = INCREMENTAL_OVERLAP_DAYS
+        if isinstance(incremental, dict):
+            overlap_days = incremental.get("overlap_days", INCREMENTAL_OVERLAP_DAYS)
+
+        start_date = last_pulled - timedelta(days=overlap_days)
+        end_date = datetime.now()
+        logger.info(f"Incremental run for {table_name}: {start_date.date()} to {end_date.date()}")
+        return start_date, end_date
+
     def _extract_table(
         self,
         table_name: str,
@@ -176,33 +263,74 @@ class FacebookPipeline:
         end_date: Optional[datetime] = None,
     ) -> pd.DataFrame:
         """Extract data for a specific table."""
+        extract = self._extractors.get(table_name)
+        if extract is None:
+            extract = self._resolve_extractor(table_name, table_config)
+
         try:
-            table_type = table_config.get("type")
-            date_preset = table_config.get("date_preset", "last_7d")
-            breakdowns = table_config.get("breakdowns")  # Extract breakdowns from config
-
-            if table_type == "get_campaigns":
-                df = self.adapter.get_all_campaigns(date_preset=date_preset)
-            elif table_type == "get_ad_sets":
-                df = self.adapter.get_all_ad_sets(date_preset=date_preset)
-            elif table_type == "get_insights":
-                if table_name == "fb_ads_insight_actions":
-                    df = self.adapter.get_all_insights_with_actions(date_preset=date_preset)
-                else:
-                    # Pass breakdowns to get_all_insights
-                    df = self.adapter.get_all_insights(date_preset=date_preset, breakdowns=breakdowns)
-            elif table_type == "get_custom_conversions":
-                df = self.adapter.get_all_custom_conversions()
-            else:
-                if table_name == "fb_ads_audience_adset":
-                    df = self.adapter.get_all_audience_targeting(date_preset=date_preset)
-                else:
-                    raise PipelineError(f"Unknown table type: {table_type}")
-            return df
+            if extract is None:
+                raise PipelineError(f"Unknown table type: {table_config.get('type')}")
+            return extract(start_date=start_date, end_date=end_date)
         except Exception as e:
             logger.error(f"Extraction failed for {table_name}: {str(e)}")
             raise PipelineError(f"Extraction failed for {table_name}: {str(e)}") from e
 
+    def _resolve_extractor(
+        self,
+        table_name: str,
+        table_config: Dict[str, Any],
+    ) -> Optional[Callable[..., pd.DataFrame]]:
+        """Bind the adapter call that extracts a table.
+
+        The returned callable accepts ``start_date``/``end_date`` keyword
+        arguments; sources without a date range ignore them.
+
+        Args:
+            table_name: Name of the table
+            table_config: Configuration of the table
+
+        Returns:
+            Extraction callable, or None if the table type is unknown
+        """
+        table_type = table_config.get("type")
+        date_preset = table_config.get("date_preset", "last_7d")
+        fields = table_config.get("fields")
+
+        if table_type == "get_campaigns":
+            return self._ignore_range(partial(self.adapter.get_all_campaigns, date_preset=date_preset))
+        if table_type == "get_ad_sets":
+            return self._ignore_range(partial(self.adapter.get_all_ad_sets, date_preset=date_preset))
+        if table_type == "get_insights":
+            if table_name == "fb_ads_insight_actions":
+                return partial(
+                    self.adapter.get_all_insights_with_actions,
+                    date_preset=date_preset,
+                    fields=fields,
+                )
+            # Pass breakdowns and field selection to get_all_insights
+            return partial(
+                self.adapter.get_all_insights,
+                date_preset=date_preset,
+                breakdowns=table_config.get("breakdowns"),
+                fields=fields,
+                field_profile=table_config.get("field_profile"),
+            )
+        if table_type == "get_custom_conversions":
+            return self._ignore_range(self.adapter.get_all_custom_conversions)
+        if table_name == "fb_ads_audience_adset":
+            return self._ignore_range(
+                partial(self.adapter.get_all_audience_targeting, date_preset=date_preset)
+            )
+        return None
+
+    @staticmethod
+    def _ignore_range(func: Callable[[], pd.DataFrame]) -> Callable[..., pd.DataFrame]:
+        """Adapt an extraction call without a date range to the extractor signature."""
+        def extract(start_date: Optional[datetime] = None, end_date: Optional[datetime] = None) -> pd.DataFrame:
+            return func()
+
+        return extract
+
     def _process_table(
         self,
         df: pd.DataFrame,
@@ -213,46 +341,59 @@ class FacebookPipeline:
         if df.empty:
             return df
 
-        processor = FacebookProcessor(df)
-        processing_steps = table_config.get("processing", {})
+        # The extracted frame is not used after processing: steps can work on it in place
+        processor = FacebookProcessor(df, copy=False)
+        plan = self._plans.get(table_name)
+        if plan is None:
+            plan = self._compile_plan(table_name, table_config.get("processing"))
 
-        for step_name, step_params in processing_steps.items():
+        for step_name, step, params in plan:
             try:
-                # Handle None or "None" string
-                if step_params is None or step_params == "None":
-                    step_params = {}
-
-                if isinstance(step_params, dict):
-                    # Extract params from nested structure
-                    if "params" in step_params:
-                        raw_params = step_params["params"]
-                        # Handle None, "None", or empty params
-                        if raw_params is None or raw_params == "None" or raw_params == "":
-                            params = {}
-                        elif isinstance(raw_params, str):
-                            # String params should be empty dict
-                            params = {}
-                        else:
-                            params = raw_params
-                    else:
-                        params = step_params
-                else:
-                    params = {}
-
-                # Ensure params is always a dict
-                if not isinstance(params, dict):
-                    params = {}
-
-                if hasattr(processor, step_name):
-                    method = getattr(processor, step_name)
-                    processor = method(**params) if params else method()
-                else:
-                    logger.warning(f"Unknown processing step: {step_name}")
+                processor = step(processor, **params)
             except Exception as e:
                 logger.error(f"Processing step '{step_name}' failed: {str(e)}")
 
         return processor.get_df()
 
+    @staticmethod
+    def _compile_plan(
+        table_name: str,
+        processing_steps: Optional[Dict[str, Any]],
+    ) -> List[Tuple[str, Callable[..., FacebookProcessor], Dict[str, Any]]]:
+        """Resolve the processing steps of a table into a reusable plan.
+
+        Step parameters are normalized (None/"None"/string params become an
+        empty dict, nested "params" are unwrapped) and step names are resolved
+        to FacebookProcessor methods, so running the plan needs no parsing.
+
+        Args:
+            table_name: Table the steps belong to (for logging)
+            processing_steps: "processing" section of the table configuration
+
+        Returns:
+            List of (step name, unbound processor method, keyword arguments)
+        """
+        plan = []
+
+        for step_name, step_params in (processing_steps or {}).items():
+            step = getattr(FacebookProcessor, step_name, None)
+            if not callable(step):
+                logger.warning(f"Unknown processing step for {table_name}: {step_name}")
+                continue
+
+            params = step_params
+            # Extract params from nested structure
+            if isinstance(params, dict) and "params" in params:
+                params = params["params"]
+
+            # None, "None", empty or string params mean no arguments
+            if not isinstance(params, dict):
+                params = {}
+
+            plan.append((step_name, step, params))
+
+        return plan
+
     def _load_to_sink(self, df: pd.DataFrame, table_name: str) -> Dict[str, int]:
         """Load processed data to the configured data sink.
 
@@ -302,10 +443,32 @@ class FacebookPipeline:
                 load_mode = "append"
                 logger.debug(f"Using append mode for {table_name}")
 
-            # Write to sink with appropriate method
-            if hasattr(self.data_sink, "load"):
-                # VerticaDataSink has load() with all modes - returns LoadStats
-                stats = self.data_sink.load(
+            # Write to sink with the method resolved at init
+            if self._sink_call is None:
+                raise PipelineError("Data sink has no compatible write/load method")
+
+            return self._sink_call(df, table_name, load_mode, pk_columns, increment_columns)
+        except Exception as e:
+            logger.error(f"Failed to load data to sink: {str(e)}")
+            raise PipelineError(f"Failed to load data to sink: {str(e)}") from e
+
+    @staticmethod
+    def _resolve_sink_call(data_sink: Optional[DataSink]) -> Optional[Callable[..., Dict[str, int]]]:
+        """Bind the write method of the data sink once.
+
+        Returns:
+            Callable ``(df, table_name, load_mode, pk_columns, increment_columns)``
+            returning a LoadStats dict, or None if the sink has no load/write method
+        """
+        if data_sink is None:
+            return None
+
+        if hasattr(data_sink, "load"):
+            # VerticaDataSink has load() with all modes - returns LoadStats
+            load = data_sink.load
+
+            def call_load(df, table_name, load_mode, pk_columns, increment_columns):
+                stats = load(
                     df=df,
                     table_name=table_name,
                     mode=load_mode,
@@ -317,12 +480,18 @@ class FacebookPipeline:
                     f"({stats.rows_inserted} new + {stats.rows_updated} updated)"
                 )
                 return stats.to_dict()
-            elif hasattr(self.data_sink, "write"):
-                # Fallback to write() method (older sinks - limited support)
+
+            return call_load
+
+        if hasattr(data_sink, "write"):
+            # Fallback to write() method (older sinks - limited support)
+            write = data_sink.write
+
+            def call_write(df, table_name, load_mode, pk_columns, increment_columns):
                 if load_mode in ["increment", "upsert"]:
                     logger.warning(f"Data sink does not support {load_mode} mode, falling back to append")
                     load_mode = "append"
-                rows_written = self.data_sink.write(df=df, table_name=table_name, if_exists=load_mode)
+                rows_written = write(df=df, table_name=table_name, if_exists=load_mode)
                 logger.success(f"Loaded {rows_written} rows to {table_name}")
                 # Legacy sink returns int, convert to LoadStats dict
                 return {
@@ -333,13 +502,10 @@ class FacebookPipeline:
                     "rows_filtered": 0,
                     "rows_written": rows_written,
                 }
-            else:
-                raise PipelineError("Data sink has no compatible write/load method")
 
-            logger.success(f"Loaded {rows_written} rows to {table_name}")
-        except Exception as e:
-            logger.error(f"Failed to load data to sink: {str(e)}")
-            raise PipelineError(f"Failed to load data to sink: {str(e)}") from e
+            return call_write
+
+        return None
 
     def get_all_tables(self) -> List[str]:
         """Get list of all configured table names.
@@ -370,16 +536,19 @@ class FacebookPipeline:
         for table_name in tables_to_process:
             if table_name not in self.table_names:
                 logger.warning(f"Table {table_name} not in configuration, skipping")
-                continue
+        tables_to_process = [name for name in tables_to_process if name in self.table_names]
 
-            try:
-                # Run pipeline for this table (without loading to sink)
-                df = self.run(table_name=table_name, load_to_sink=False)
-                results[table_name] = df
-            except Exception as e:
-                logger.error(f"Failed to extract {table_name}: {e}")
+        # Run pipeline for each table in parallel (without loading to sink)
+        outcomes = self._run_tables(tables_to_process, load_to_sink=False)
+
+        for table_name in tables_to_process:
+            outcome = outcomes[table_name]
+            if isinstance(outcome, Exception):
+                logger.error(f"Failed to extract {table_name}: {outcome}")
                 # Continue with other tables
                 results[table_name] = pd.DataFrame()
+            else:
+                results[table_name] = outcome[0]
 
         return results
 
@@ -390,11 +559,28 @@ class FacebookPipeline:
             logger.debug("Pipeline resources closed")
 
 
+# libyaml C parser when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@lru_cache(maxsize=8)
+def _parse_config(config_path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a YAML config file (cached per path and modification time).
+
+    The file is read in one call and parsed from memory.
+    """
+    return yaml.load(Path(config_path).read_bytes(), Loader=_YAML_LOADER)
+
+
 def load_config(config_path: Path) -> Dict[str, Any]:
-    """Load pipeline configuration from YAML file."""
+    """Load pipeline configuration from YAML file.
+
+    Parsed files are cached until they change on disk; callers get their
+    own copy, so mutating it does not affect later loads.
+    """
     try:
-        with open(config_path, "r", encoding="utf-8") as f:
-            config = yaml.safe_load(f)
+        config_path = Path(config_path)
+        config = copy.deepcopy(_parse_config(str(config_path), config_path.stat().st_mtime_ns))
         logger.info(f"Loaded configuration from {config_path}")
         return config
     except Exception as e:
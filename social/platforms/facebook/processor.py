@@ -20,14 +20,68 @@ Architecture:
 import json
 import re
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from itertools import chain
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
+from joblib import Parallel, delayed
 from loguru import logger
 
-from social.platforms.facebook.constants import COMPANY_ACCOUNT_MAP
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+from social.platforms.facebook.constants import (
+    COMPANY_ACCOUNT_MAP,
+    INSIGHT_FLOAT64_COLUMNS,
+    INSIGHT_INT32_COLUMNS,
+    TARGETING_BLOCK_SIZE,
+    TARGETING_PARALLEL_MIN_ROWS,
+)
 from social.utils.aggregation import aggregate_metrics_by_entity
+from social.utils.commons import EMOJI_RE, combine_arrow_chunks, to_arrow_strings
+
+# Account IDs are mapped with and without the "act_" prefix: resolve both forms
+# with a single lookup
+_COMPANY_BY_ACCOUNT: Dict[str, int] = {
+    **{f"act_{account_id}": company_id for account_id, company_id in COMPANY_ACCOUNT_MAP.items()},
+    **COMPANY_ACCOUNT_MAP,
+}
+
+
+def _expand_custom_audiences(rows: Iterable[Tuple[Any, Any, Any]]) -> List[Dict[str, Any]]:
+    """Expand (campaign_id, adset_id, targeting) rows into one record per custom audience."""
+    records = []
+    append = records.append
+
+    for campaign_id, adset_id, targeting in rows:
+        # Targeting may arrive as a raw JSON string instead of a parsed dict
+        if isinstance(targeting, str):
+            try:
+                targeting = _json_loads(targeting)
+            except ValueError:
+                continue
+
+        if isinstance(targeting, dict):
+            for audience in targeting.get("custom_audiences") or []:
+                append({
+                    "campaign_id": campaign_id,
+                    "adset_id": adset_id,
+                    "audience_id": audience.get("id"),
+                    "audience_name": audience.get("name"),
+                })
+
+    return records
+
+
+def _parse_pixel_rule(jrule: Dict[str, Any]) -> Tuple[Any, str]:
+    """Extract (event rule, URL triggers) from a parsed custom conversion rule."""
+    and_rules = jrule.get("and", [{}] * 2)
+    event_rule = and_rules[0].get("event", {}).get("eq")
+    all_url_rule = str(and_rules[1].get("or", {}))
+    return event_rule, all_url_rule
 
 
 class FacebookProcessor:
@@ -55,13 +109,19 @@ class FacebookProcessor:
         df: The DataFrame being processed
     """
 
-    def __init__(self, df: pd.DataFrame):
+    def __init__(self, df: pd.DataFrame, copy: bool = True):
         """Initialize processor with a DataFrame.
 
         Args:
             df: Raw DataFrame from API response
+            copy: Copy the DataFrame first; pass False when the caller hands
+                over a frame it does not use afterwards (saves a full pass)
         """
-        self.df = df.copy() if not df.empty else pd.DataFrame()
+        if df.empty:
+            self.df = pd.DataFrame()
+        else:
+            # Text columns are processed as Arrow strings (compact, vectorized .str)
+            self.df = to_arrow_strings(df.copy() if copy else df)
         logger.debug(f"FacebookProcessor initialized with {len(self.df)} rows")
 
     def get_df(self) -> pd.DataFrame:
@@ -97,21 +157,8 @@ class FacebookProcessor:
 
         logger.info(f"Extracting nested actions from '{action_col}'")
 
-        # Convert actions to dictionaries
-        for idx, row in self.df.iterrows():
-            actions = row[action_col]
-
-            if isinstance(actions, list) and len(actions) > 0:
-                for action in actions:
-                    if isinstance(action, dict):
-                        action_type = action.get("action_type")
-                        value = action.get("value", 0)
-
-                        if action_type:
-                            # Create column name: action_link_click, action_purchase, etc.
-                            col_name = f"{prefix}{action_type}"
-                            self.df.at[idx, col_name] = value
-
+        # Create one column per action type: action_link_click, action_purchase, etc.
+        self._spread_nested(action_col, prefix)
         logger.debug(f"Extracted actions into separate columns")
         return self
 
@@ -137,22 +184,50 @@ class FacebookProcessor:
 
         logger.info(f"Extracting nested action values from '{col}'")
 
-        # Convert action_values to dictionaries
-        for idx, row in self.df.iterrows():
-            action_values = row[col]
+        self._spread_nested(col, prefix)
+        logger.debug(f"Extracted action values into separate columns")
+        return self
 
-            if isinstance(action_values, list) and len(action_values) > 0:
-                for action_val in action_values:
-                    if isinstance(action_val, dict):
-                        action_type = action_val.get("action_type")
-                        value = action_val.get("value", 0)
+    def _spread_nested(self, col: str, prefix: str) -> None:
+        """Spread a column of [{"action_type": ..., "value": ...}] lists into wide columns.
 
-                        if action_type:
-                            col_name = f"{prefix}{action_type}"
-                            self.df.at[idx, col_name] = value
+        The lists are exploded and pivoted in one pass; each action type becomes
+        a ``{prefix}{action_type}`` column (in order of first appearance) and rows
+        without that action stay NaN. If an action type repeats within a row, the
+        last value wins.
 
-        logger.debug(f"Extracted action values into separate columns")
-        return self
+        Args:
+            col: Column containing the nested lists
+            prefix: Prefix for the new column names
+        """
+        nested = pd.Series(
+            self.df[col].map(lambda a: a if isinstance(a, list) else None).to_numpy(),
+            dtype=object,
+        ).explode()
+
+        records = [
+            (pos, item.get("action_type"), item.get("value", 0))
+            for pos, item in zip(nested.index, nested.to_numpy())
+            if isinstance(item, dict) and item.get("action_type")
+        ]
+        if not records:
+            return
+
+        long_df = pd.DataFrame(records, columns=["pos", "action_type", "value"])
+        action_types = long_df["action_type"].unique()
+        wide = (
+            long_df.drop_duplicates(["pos", "action_type"], keep="last")
+            .pivot(index="pos", columns="action_type", values="value")
+            .reindex(index=range(len(self.df)), columns=action_types)
+        )
+        wide.columns = [f"{prefix}{action_type}" for action_type in action_types]
+        wide.index = self.df.index
+
+        # Columns that already exist only get the cells carrying a value
+        existing = [c for c in wide.columns if c in self.df.columns]
+        for c in existing:
+            self.df[c] = wide[c].combine_first(self.df[c])
+        self.df = pd.concat([self.df, wide.drop(columns=existing)], axis=1)
 
     def parse_targeting_field(
         self,
@@ -176,23 +251,21 @@ class FacebookProcessor:
         logger.info(f"Parsing targeting field from '{targeting_col}'")
         logger.debug(f"Available columns before parsing: {list(self.df.columns)}")
 
-        df_list = []
-
-        for idx, row in self.df.iterrows():
-            targeting = row[targeting_col]
-
-            if isinstance(targeting, dict):
-                custom_audiences = targeting.get("custom_audiences", [])
-
-                if custom_audiences:
-                    for audience in custom_audiences:
-                        audience_row = {
-                            "campaign_id": row.get("campaign_id") if "campaign_id" in row else None,
-                            "adset_id": row.get("id") if "id" in row else None,
-                            "audience_id": audience.get("id"),
-                            "audience_name": audience.get("name"),
-                        }
-                        df_list.append(audience_row)
+        # Read whole columns once instead of materializing a Series per row
+        missing = [None] * len(self.df)
+        campaign_ids = self.df["campaign_id"].to_numpy() if "campaign_id" in self.df.columns else missing
+        adset_ids = self.df["id"].to_numpy() if "id" in self.df.columns else missing
+        rows = list(zip(campaign_ids, adset_ids, self.df[targeting_col].to_numpy()))
+
+        if len(rows) >= TARGETING_PARALLEL_MIN_ROWS:
+            # Threads avoid pickling the targeting dicts; results keep input order
+            blocks = [rows[i:i + TARGETING_BLOCK_SIZE] for i in range(0, len(rows), TARGETING_BLOCK_SIZE)]
+            results = Parallel(n_jobs=-1, prefer="threads")(
+                delayed(_expand_custom_audiences)(block) for block in blocks
+            )
+            df_list = list(chain.from_iterable(results))
+        else:
+            df_list = _expand_custom_audiences(rows)
 
         if df_list:
             # Replace DataFrame with extracted audiences
@@ -223,9 +296,13 @@ class FacebookProcessor:
                 logger.warning(f"Column '{col}' not found, skipping timestamp conversion")
                 continue
 
+            if pd.api.types.is_datetime64_any_dtype(self.df[col]):
+                logger.debug(f"Column '{col}' is already datetime, skipping timestamp conversion")
+                continue
+
             try:
-                # Try parsing as datetime string
-                self.df[col] = pd.to_datetime(self.df[col], errors="coerce")
+                # Try parsing as datetime string; repeated values are parsed once
+                self.df[col] = pd.to_datetime(self.df[col], errors="coerce", cache=True)
                 logger.debug(f"Converted timestamp column: {col}")
             except Exception as e:
                 logger.error(f"Failed to convert timestamp column '{col}': {e}")
@@ -251,7 +328,8 @@ class FacebookProcessor:
             logger.warning("No column mapping provided to rename_columns")
             return self
 
-        self.df = self.df.rename(columns=mapping)
+        # Relabel in place: the processor owns self.df, no new frame is needed
+        self.df.rename(columns=mapping, inplace=True)
         logger.debug(f"Renamed columns: {mapping}")
         return self
 
@@ -294,10 +372,8 @@ class FacebookProcessor:
             logger.warning(f"Account column '{account_column}' not found, skipping company mapping")
             return self
 
-        # Map account IDs to company IDs
-        self.df["companyid"] = self.df[account_column].apply(
-            lambda x: self._get_company_id(str(x))
-        )
+        company_ids = self.df[account_column].astype(str).map(_COMPANY_BY_ACCOUNT)
+        self.df["companyid"] = company_ids.fillna(1).astype("int64")
 
         logger.debug(f"Added company IDs for {len(self.df)} rows")
         return self
@@ -314,6 +390,8 @@ class FacebookProcessor:
         if self.df.empty:
             return self
 
+        # Plain date values: every sink (Vertica DATE cast, Azure Table str(date))
+        # expects a date, not a midnight timestamp
         today = datetime.now().date()
         self.df["load_date"] = today
         logger.debug("Added load_date column")
@@ -339,12 +417,16 @@ class FacebookProcessor:
         if self.df.empty:
             return self
 
+        existing = []
         for col in columns:
             if col not in self.df.columns:
                 logger.warning(f"Column '{col}' not found, skipping ID type fix")
                 continue
+            existing.append(col)
 
-            self.df[col] = self.df[col].astype(str)
+        # Cast all columns together and write them back with a single assignment
+        if existing:
+            self.df[existing] = self.df[existing].astype(str)
 
         logger.debug(f"Fixed ID types for columns: {columns}")
         return self
@@ -369,6 +451,54 @@ class FacebookProcessor:
 
         return self
 
+    def downcast_metrics(
+        self,
+        int_columns: Optional[List[str]] = None,
+        float_columns: Optional[List[str]] = None,
+        category_columns: Optional[List[str]] = None,
+    ) -> "FacebookProcessor":
+        """Convert string metrics to compact numeric dtypes.
+
+        Facebook returns every metric as a string. Counts become int32 (int64
+        if they overflow, float64 if they contain NaN), spend and ratios
+        float64. Only the columns listed in float_columns are stored as
+        float32, since they lose precision when summed or loaded. Optional
+        category_columns (e.g. repeated IDs) become categorical.
+
+        Args:
+            int_columns: Count columns (default: INSIGHT_INT32_COLUMNS)
+            float_columns: Columns to store as float32 - optional
+            category_columns: Columns to store as category - optional
+
+        Returns:
+            Self for chaining
+        """
+        if self.df.empty:
+            return self
+
+        int32_info = np.iinfo(np.int32)
+        int_columns = INSIGHT_INT32_COLUMNS if int_columns is None else int_columns
+        float_columns = float_columns or []
+
+        for col in (c for c in int_columns if c in self.df.columns):
+            values = pd.to_numeric(self.df[col], errors="coerce")
+            if values.notna().all():
+                fits_int32 = values.between(int32_info.min, int32_info.max).all()
+                values = values.astype("int32" if fits_int32 else "int64")
+            self.df[col] = values
+
+        for col in (c for c in float_columns if c in self.df.columns):
+            self.df[col] = pd.to_numeric(self.df[col], errors="coerce").astype("float32")
+
+        for col in (c for c in INSIGHT_FLOAT64_COLUMNS if c in self.df.columns and c not in float_columns):
+            self.df[col] = pd.to_numeric(self.df[col], errors="coerce").astype("float64")
+
+        for col in (c for c in category_columns or [] if c in self.df.columns):
+            self.df[col] = self.df[col].astype("category")
+
+        logger.debug(f"Downcast metrics, memory usage: {self.df.memory_usage(deep=True).sum()} bytes")
+        return self
+
     def rename_column(self, renaming: Dict[str, str]) -> "FacebookProcessor":
         """Rename columns according to a mapping.
 
@@ -388,7 +518,7 @@ class FacebookProcessor:
         }
 
         if valid_renames:
-            self.df = self.df.rename(columns=valid_renames)
+            self.df.rename(columns=valid_renames, inplace=True)
             logger.debug(f"Renamed {len(valid_renames)} columns")
 
         return self
@@ -405,12 +535,16 @@ class FacebookProcessor:
         if self.df.empty:
             return self
 
+        existing = []
         for col in columns:
             if col not in self.df.columns:
                 logger.warning(f"Column '{col}' not found, skipping string conversion")
                 continue
+            existing.append(col)
 
-            self.df[col] = self.df[col].astype(str)
+        # Cast all columns together and write them back with a single assignment
+        if existing:
+            self.df[existing] = self.df[existing].astype(str)
 
         logger.debug(f"Converted columns to string: {columns}")
         return self
@@ -457,17 +591,63 @@ class FacebookProcessor:
         # Support both 'columns' and 'cols' parameter names
         col_list = columns or cols or []
 
+        present = []
         for col in col_list:
             if col not in self.df.columns:
                 logger.warning(f"Column '{col}' not found, skipping name modification")
                 continue
 
-            if self.df[col].dtype == object:  # String column
-                self.df[col] = self.df[col].str.replace("|", "-", regex=False)
+            if pd.api.types.is_string_dtype(self.df[col]) or self.df[col].dtype == object:  # String column
+                present.append(col)
+
+        # Replace in all string columns, then write them back with a single assignment
+        if present:
+            self.df[present] = self.df[present].apply(lambda s: s.str.replace("|", "-", regex=False))
 
         logger.debug(f"Modified name columns: {columns}")
         return self
 
+    def utf_8_encoding(self, columns: Optional[List[str]] = None, cols: Optional[List[str]] = None) -> "FacebookProcessor":
+        """Clean free-text columns (e.g. ad creative name/body) for loading.
+
+        Removes pipe characters (COPY delimiter), emojis and characters that
+        cannot be encoded as UTF-8. Each step runs on the whole column through
+        the pandas string accessor.
+
+        Args:
+            columns: List of column names to clean (preferred)
+            cols: Alias for columns (for backward compatibility)
+
+        Returns:
+            Self for chaining
+        """
+        if self.df.empty:
+            return self
+
+        # Support both 'columns' and 'cols' parameter names
+        col_list = columns or cols or []
+
+        for col in col_list:
+            if col not in self.df.columns:
+                logger.warning(f"Column '{col}' not found, skipping UTF-8 encoding")
+                continue
+
+            # Mixed-type columns are left untouched: .str would turn non-strings into NaN
+            if pd.api.types.infer_dtype(self.df[col], skipna=True) not in ("string", "empty"):
+                logger.warning(f"Column '{col}' is not a text column, skipping UTF-8 encoding")
+                continue
+
+            self.df[col] = (
+                self.df[col]
+                .str.replace("|", "", regex=False)
+                .str.replace(EMOJI_RE, "", regex=True)
+                .str.encode("utf-8", errors="ignore")
+                .str.decode("utf-8")
+            )
+
+        logger.debug(f"UTF-8 encoded columns: {col_list}")
+        return self
+
     def extract_pixel_rule(
         self,
         rule_column: str = "rule",
@@ -491,32 +671,34 @@ class FacebookProcessor:
 
         logger.info("Extracting pixel rules from custom conversions")
 
-        pixel_rules = []
+        ids = self.df[id_column].to_numpy() if id_column in self.df.columns else [None] * len(self.df)
+
+        # Conversions of the same pixel often share a rule: parse each distinct rule once
+        parsed: Dict[str, Any] = {}
+        no_rule = (None, None)
 
-        for idx, row in self.df.iterrows():
-            rule = row[rule_column]
+        def extract(rule: Any, conversion_id: Any) -> Tuple[Any, Optional[str]]:
+            if not isinstance(rule, str) or not rule:
+                return no_rule
 
-            if isinstance(rule, str) and rule:
+            result = parsed.get(rule)
+            if result is None:
                 try:
-                    jrule = json.loads(rule)
-
-                    # Extract event rule and URL triggers
-                    event_rule = jrule.get("and", [{}])[0].get("event", {}).get("eq")
-                    all_url_rule = jrule.get("and", [{}] * 2)[1].get("or", {})
-
-                    pixel_rules.append({
-                        "RULE": event_rule,
-                        "CONV_TRIGGER": str(all_url_rule),
-                    })
-                except (json.JSONDecodeError, IndexError, KeyError, AttributeError) as e:
-                    logger.warning(f"Failed to parse rule for conversion {row.get(id_column)}: {e}")
-                    pixel_rules.append({"RULE": None, "CONV_TRIGGER": None})
-            else:
-                pixel_rules.append({"RULE": None, "CONV_TRIGGER": None})
+                    result = parsed[rule] = _parse_pixel_rule(_json_loads(rule))
+                except (ValueError, IndexError, KeyError, AttributeError) as e:
+                    result = parsed[rule] = e
+
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to parse rule for conversion {conversion_id}: {result}")
+                return no_rule
+            return result
+
+        results = [extract(rule, conversion_id) for rule, conversion_id in zip(self.df[rule_column].to_numpy(), ids)]
 
         # Add pixel_rule columns
-        self.df["pixel_rule"] = [r["RULE"] for r in pixel_rules]
-        self.df["pixel_trigger"] = [r["CONV_TRIGGER"] for r in pixel_rules]
+        events, triggers = zip(*results)
+        self.df["pixel_rule"] = list(events)
+        self.df["pixel_trigger"] = list(triggers)
 
         logger.debug(f"Extracted pixel rules for {len(self.df)} conversions")
         return self
@@ -548,38 +730,24 @@ class FacebookProcessor:
 
         logger.info("Converting actions to long format DataFrame")
 
-        response_list = []
-        i = 0
-
-        for idx, row in self.df.iterrows():
-            row_id = row.get(id_column)
-            actions = row.get(actions_column)
-
-            if isinstance(actions, list) and len(actions) > 0:
-                # Convert list of dicts to DataFrame
-                act_tmp = pd.DataFrame(actions)
-                act_tmp[id_column] = row_id
-                response_list.append(act_tmp)
-            else:
-                # No actions - create empty row with NaN
-                response_list.append(
-                    pd.DataFrame(
-                        {
-                            "action_target_id": [None],
-                            "action_type": [None],
-                            "value": [None],
-                            id_column: [row_id],
-                        },
-                        index=[i],
-                    )
-                )
-                i += 1
-
-        if response_list:
-            self.df = pd.concat(response_list, ignore_index=True)
-            logger.success(f"Converted to {len(self.df)} action rows")
-        else:
-            self.df = pd.DataFrame()
+        # One row per action: explode the lists in a single pass. Rows without
+        # actions (empty list, NaN) keep a single placeholder row
+        exploded = pd.DataFrame({
+            id_column: self.df[id_column].to_numpy() if id_column in self.df.columns else None,
+            actions_column: self.df[actions_column].to_numpy(),
+        }).explode(actions_column, ignore_index=True)
+
+        action_df = pd.DataFrame(
+            [a if isinstance(a, dict) else {} for a in exploded[actions_column]],
+            index=exploded.index,
+        )
+        for col in ("action_target_id", "action_type", "value"):
+            if col not in action_df.columns:
+                action_df[col] = None
+        action_df[id_column] = exploded[id_column]
+
+        self.df = combine_arrow_chunks(action_df)
+        logger.success(f"Converted to {len(self.df)} action rows")
 
         return self
 
@@ -605,23 +773,27 @@ class FacebookProcessor:
             self.df["conversion_id"] = None
             return self
 
-        # Split action_type by 'offsite_conversion.custom.'
-        id_parts = self.df["action_type"].str.split("offsite_conversion.custom.", expand=True)
-
-        try:
-            # Column 1 contains the conversion ID (if split succeeded)
-            self.df["conversion_id"] = id_parts[1]
-            logger.debug(f"Extracted conversion IDs for {self.df['conversion_id'].notna().sum()} rows")
-        except KeyError:
-            # No conversion ID found in any row
+        # Keep the suffix of action types starting with the custom conversion prefix
+        prefix = "offsite_conversion.custom."
+        action_types = self.df["action_type"]
+        if action_types.isna().all():
             self.df["conversion_id"] = None
             logger.debug("No conversion IDs found in action_type")
+            return self
+
+        is_custom = action_types.str.startswith(prefix, na=False)
+        self.df["conversion_id"] = action_types.where(is_custom).str.slice(len(prefix))
+        logger.debug(f"Extracted conversion IDs for {int(is_custom.sum())} rows")
 
         return self
 
     def nan_conversion(self, **kwargs) -> "FacebookProcessor":
         """Convert NaN values to None for database compatibility.
 
+        Only text (object/string) columns that contain missing values are
+        converted; numeric and datetime columns keep their dtype, missing
+        values there are written as NULL by the sink.
+
         Args:
             **kwargs: Ignored for compatibility with YAML config (params: None)
 
@@ -631,9 +803,52 @@ class FacebookProcessor:
         if self.df.empty:
             return self
 
-        # Replace NaN with None throughout DataFrame
-        self.df = self.df.where(pd.notna(self.df), None)
-        logger.debug("Converted NaN to None")
+        text_cols = [
+            col for col in self.df.columns
+            if pd.api.types.is_object_dtype(self.df[col]) or pd.api.types.is_string_dtype(self.df[col])
+        ]
+        if text_cols:
+            missing = self.df[text_cols].isna()
+            text_cols = list(missing.columns[missing.any().to_numpy()])
+        if text_cols:
+            subset = self.df[text_cols]
+            self.df[text_cols] = subset.astype(object).where(subset.notna(), None)
+
+        logger.debug(f"Converted NaN to None for columns: {text_cols}")
+        return self
+
+    def finalize_nulls(
+        self,
+        zero_cols: Optional[List[str]] = None,
+        none_cols: Optional[List[str]] = None,
+    ) -> "FacebookProcessor":
+        """Prepare missing values for loading in a single step.
+
+        Combines replace_nan_with_zero and convert_nat_to_nan: zero_cols get
+        NaN replaced by 0, none_cols get NaN/NaT replaced by None (as object
+        columns). Each group is read and written back once; other columns keep
+        their dtype.
+
+        Args:
+            zero_cols: Columns where missing values become 0
+            none_cols: Columns where missing values become None
+
+        Returns:
+            Self for chaining
+        """
+        if self.df.empty:
+            return self
+
+        zero_cols = [c for c in zero_cols or [] if c in self.df.columns]
+        none_cols = [c for c in none_cols or [] if c in self.df.columns]
+
+        if zero_cols:
+            self.df[zero_cols] = self.df[zero_cols].fillna(0)
+        if none_cols:
+            subset = self.df[none_cols]
+            self.df[none_cols] = subset.astype(object).where(subset.notna(), None)
+
+        logger.debug(f"Finalized nulls (zero: {zero_cols}, none: {none_cols})")
         return self
 
     def deal_with_date(self, columns: Optional[List[str]] = None, cols: Optional[List[str]] = None) -> "FacebookProcessor":
@@ -670,25 +885,18 @@ class FacebookProcessor:
                 # Facebook returns format: "2024-01-15T10:30:00+0000" (UTC)
                 # OLD project converted to Europe/Rome timezone before saving (UTC+1/UTC+2)
 
-                # Replace NaN/None first (OLD project behavior)
-                self.df[col] = self.df[col].replace({np.nan: 0, 0: None})
+                # Single vectorized parse: NaN/None/unparseable values become NaT
+                raw = self.df[col]
+                parsed = pd.to_datetime(raw, format="ISO8601", utc=True, errors="coerce")
 
-                # Parse datetime strings with timezone
-                self.df[col] = self.df[col].apply(
-                    lambda x: pd.to_datetime(x, format="%Y-%m-%dT%H:%M:%S%z", errors="coerce")
-                    if not (isinstance(x, float) or x is None)
-                    else x
-                )
-
-                # Convert to UTC-aware Series first (normalize all timezones)
-                self.df[col] = pd.to_datetime(self.df[col], utc=True, errors="coerce")
+                # Values outside ISO8601 get a second, per-value inferred parse of just that subset
+                retry = parsed.isna() & raw.notna()
+                if retry.any():
+                    parsed[retry] = pd.to_datetime(raw[retry], format="mixed", utc=True, errors="coerce")
 
                 # Convert from UTC to Europe/Rome timezone (matches OLD project behavior)
-                # This applies UTC+1 (or UTC+2 during DST)
-                if pd.api.types.is_datetime64tz_dtype(self.df[col]):
-                    self.df[col] = self.df[col].dt.tz_convert('Europe/Rome')
-                    # Remove timezone to make naive (required for Vertica TIMESTAMP)
-                    self.df[col] = self.df[col].dt.tz_localize(None)
+                # and remove timezone to make naive (required for Vertica TIMESTAMP)
+                self.df[col] = parsed.dt.tz_convert("Europe/Rome").dt.tz_localize(None)
 
                 logger.debug(f"Converted date column: {col} to Europe/Rome naive datetime")
             except Exception as e:
@@ -762,15 +970,7 @@ class FacebookProcessor:
         Returns:
             Company ID (defaults to 1 if not found)
         """
-        # Remove "act_" prefix if present
-        clean_id = account_id.replace("act_", "")
-
-        # Try both formats
-        company_id = COMPANY_ACCOUNT_MAP.get(account_id)
-        if company_id is None:
-            company_id = COMPANY_ACCOUNT_MAP.get(clean_id, 1)
-
-        return company_id
+        return _COMPANY_BY_ACCOUNT.get(account_id, 1)
 
     def aggregate_by_entity(
         self,
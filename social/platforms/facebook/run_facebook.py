@@ -29,6 +29,7 @@ Environment Variables:
     - STORAGE_TYPE: "vertica" (default) or "azure_table"
     - CREDENTIALS_FILE: Path to credentials YAML file
     - LOG_LEVEL: Logging level (default: INFO)
+    - FACEBOOK_STATE_FILE: JSON file with last pulled dates (enables incremental tables)
 
     For Vertica:
     - VERTICA_HOST, VERTICA_PORT, VERTICA_DATABASE
@@ -48,20 +49,23 @@ Exit Codes:
 
 import os
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
-import yaml
 from loguru import logger
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+# Add the repository root to the path when run as a script; package imports
+# already resolve it
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 
 from social.core.exceptions import AuthenticationError, ConfigurationError, PipelineError
 from social.core.protocols import DataSink, TokenProvider
+from social.infrastructure.file_state_store import FileStateStore
 from social.infrastructure.file_token_provider import FileBasedTokenProvider
-from social.platforms.facebook.pipeline import FacebookPipeline
+from social.platforms.facebook.pipeline import FacebookPipeline, load_config
 
 
 def setup_logging(log_level: str = "INFO") -> None:
@@ -77,10 +81,15 @@ def setup_logging(log_level: str = "INFO") -> None:
     # Add console handler
     # Note: We don't set colorize parameter to let loguru auto-detect terminal capabilities
     # This ensures logs render correctly in Azure Container Apps (no ANSI codes)
+    # Without a terminal (containers), skip the extended tracebacks and variable
+    # dumps loguru builds for every logged exception
+    interactive = sys.stdout.isatty()
     logger.add(
         sys.stdout,
         format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
         level=log_level,
+        backtrace=interactive,
+        diagnose=interactive,
     )
 
     # Add file handler (optional, for debugging)
@@ -99,6 +108,32 @@ def setup_logging(log_level: str = "INFO") -> None:
         logger.info(f"File logging enabled: {log_file}")
 
 
+# Environment variables each STORAGE_TYPE needs (checked before any setup step)
+_REQUIRED_SINK_VARS: Dict[str, List[str]] = {
+    "vertica": ["VERTICA_HOST", "VERTICA_USER", "VERTICA_PASSWORD", "VERTICA_DATABASE"],
+    "azure_table": ["AZURE_STORAGE_CONNECTION_STRING"],
+}
+
+
+def validate_environment() -> None:
+    """
+    Check required environment variables before any setup work.
+
+    Raises:
+        ConfigurationError: If required variables are missing
+    """
+    storage_type = os.getenv("STORAGE_TYPE", "vertica").lower()
+    required = ["FACEBOOK_APP_ID", "FACEBOOK_APP_SECRET"] + _REQUIRED_SINK_VARS.get(storage_type, [])
+
+    # Only absence is checked here; the setup steps still validate the values
+    missing = [name for name in required if name not in os.environ]
+    if missing:
+        raise ConfigurationError(
+            f"Missing required environment variables: {', '.join(missing)}",
+            details={"storage_type": storage_type, "missing": missing},
+        )
+
+
 def load_configuration() -> Dict[str, Any]:
     """
     Load Facebook Ads platform configuration from YAML.
@@ -119,14 +154,14 @@ def load_configuration() -> Dict[str, Any]:
             raise ConfigurationError(f"Configuration file not found: {config_file}")
 
         # Load YAML configuration
-        with open(config_file, "r", encoding="utf-8") as f:
-            config = yaml.safe_load(f)
+        config = load_config(config_file)
 
         logger.success("Configuration loaded successfully")
 
-        # Extract table names
-        table_names = [k for k in config.keys() if k.startswith("fb_ads_")]
-        logger.debug(f"Tables configured: {table_names}")
+        # Table names are only collected when DEBUG logging is enabled
+        logger.opt(lazy=True).debug(
+            "Tables configured: {}", lambda: [k for k in config if k.startswith("fb_ads_")]
+        )
 
         return config
 
@@ -189,7 +224,7 @@ def get_ad_account_ids(token_provider: Any = None) -> List[str]:
 
         if account_ids_str:
             # Split by comma and strip whitespace
-            account_ids = [aid.strip() for aid in account_ids_str.split(",") if aid.strip()]
+            account_ids = [aid for part in account_ids_str.split(",") if (aid := part.strip())]
             if account_ids:
                 logger.info(f"Configured {len(account_ids)} ad account(s) from environment")
                 return account_ids
@@ -230,16 +265,17 @@ def setup_data_sink() -> Optional[DataSink]:
     logger.info(f"Setting up data sink: {storage_type}")
 
     try:
-        if storage_type == "vertica":
-            return setup_vertica_sink()
-        elif storage_type == "azure_table":
-            return setup_azure_table_sink()
-        elif storage_type == "none":
+        if storage_type == "none":
             logger.warning("No data sink configured - data will not be persisted")
             return None
-        else:
+
+        setup_sink = _SINK_SETUP.get(storage_type)
+        if setup_sink is None:
             raise ConfigurationError(f"Unknown storage type: {storage_type}")
 
+        # Only the selected backend's module is imported
+        return setup_sink()
+
     except Exception as e:
         logger.error(f"Failed to setup data sink: {e}")
         raise
@@ -356,6 +392,13 @@ def setup_azure_table_sink() -> Any:
         raise ConfigurationError("Azure Table setup failed") from e
 
 
+# Data sink setup per STORAGE_TYPE value
+_SINK_SETUP: Dict[str, Callable[[], Any]] = {
+    "vertica": setup_vertica_sink,
+    "azure_table": setup_azure_table_sink,
+}
+
+
 def run_pipeline(
     config: Dict[str, Any],
     token_provider: TokenProvider,
@@ -387,6 +430,10 @@ def run_pipeline(
         if not app_id or not app_secret:
             raise ConfigurationError("FACEBOOK_APP_ID and FACEBOOK_APP_SECRET must be set")
 
+        # Incremental state is optional: without it every run uses the configured date_preset
+        state_file = os.getenv("FACEBOOK_STATE_FILE")
+        state_store = FileStateStore(state_file) if state_file else None
+
         # Create pipeline
         pipeline = FacebookPipeline(
             config=config,
@@ -395,16 +442,18 @@ def run_pipeline(
             app_id=app_id,
             app_secret=app_secret,
             data_sink=data_sink,
+            state_store=state_store,
         )
 
         # Run all configured tables
         logger.info("Starting pipeline execution for all tables")
         start_time = datetime.now()
+        started = time.monotonic()
 
         results_stats, errors = pipeline.run_all_tables()
 
-        # Calculate duration
-        duration = (datetime.now() - start_time).total_seconds()
+        # Calculate duration (monotonic clock: unaffected by wall-clock adjustments)
+        duration = time.monotonic() - started
 
         # Log summary
         logger.success(
@@ -468,6 +517,9 @@ def main() -> int:
     pipeline_start = datetime.now()
 
     try:
+        # Fail before any setup work if the environment is incomplete
+        validate_environment()
+
         # Step 1: Load configuration
         logger.info("\n[1/5] Loading configuration...")
         config = load_configuration()
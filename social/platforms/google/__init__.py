@@ -36,15 +36,29 @@ Example:
     results = pipeline.run_all_tables()
 """
 
+import importlib
 import os
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 from social import read_config
 from social.platforms.google.fields import *
 
-# Backward compatibility - legacy config loading
-cfg_google_ads = read_config(
-    os.path.join(os.path.dirname(__file__), "googleads_config.yml")
-)
+if TYPE_CHECKING:
+    # Resolved lazily by __getattr__ at runtime; imported here for linters and IDEs
+    from social.platforms.google.adapter import GoogleAdapter
+    from social.platforms.google.constants import (
+        API_VERSION,
+        COMPANY_ACCOUNT_MAP,
+        DEFAULT_LOOKBACK_DAYS,
+        GAQL_QUERIES,
+        MICROS_DIVISOR,
+    )
+    from social.platforms.google.http_client import GoogleHTTPClient
+    from social.platforms.google.pipeline import GooglePipeline, load_config
+    from social.platforms.google.processor import GoogleProcessor
+
+    cfg_google_ads: dict
 
 cfg_config_google_ads_key_9474097201 = os.path.join(
     os.path.dirname(__file__), "google-ads-9474097201.yml"
@@ -83,18 +97,42 @@ manager_to_company = {
     "7604543417": 30,
 }
 
-# New independent implementation
-from social.platforms.google.adapter import GoogleAdapter
-from social.platforms.google.constants import (
-    API_VERSION,
-    COMPANY_ACCOUNT_MAP,
-    DEFAULT_LOOKBACK_DAYS,
-    GAQL_QUERIES,
-    MICROS_DIVISOR,
-)
-from social.platforms.google.http_client import GoogleHTTPClient
-from social.platforms.google.pipeline import GooglePipeline, load_config
-from social.platforms.google.processor import GoogleProcessor
+# Submodules pulling in the Google Ads client (gRPC/protobuf) are imported on
+# first access of one of their names (PEP 562), so importing a lightweight
+# submodule such as processor or constants does not load them
+_LAZY_ATTRS = {
+    "GoogleAdapter": "social.platforms.google.adapter",
+    "GoogleHTTPClient": "social.platforms.google.http_client",
+    "GooglePipeline": "social.platforms.google.pipeline",
+    "load_config": "social.platforms.google.pipeline",
+    "GoogleProcessor": "social.platforms.google.processor",
+    "API_VERSION": "social.platforms.google.constants",
+    "COMPANY_ACCOUNT_MAP": "social.platforms.google.constants",
+    "DEFAULT_LOOKBACK_DAYS": "social.platforms.google.constants",
+    "GAQL_QUERIES": "social.platforms.google.constants",
+    "MICROS_DIVISOR": "social.platforms.google.constants",
+}
+
+
+@lru_cache(maxsize=1)
+def _legacy_config() -> dict:
+    """Parse googleads_config.yml once, on first use."""
+    return read_config(os.path.join(os.path.dirname(__file__), "googleads_config.yml"))
+
+
+def __getattr__(name: str):
+    # Backward compatibility - legacy config loading
+    if name == "cfg_google_ads":
+        return _legacy_config()
+
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     # Main pipeline
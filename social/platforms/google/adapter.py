@@ -17,8 +17,11 @@ Design:
 - Production-ready error handling
 """
 
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import pandas as pd
 from loguru import logger
@@ -26,10 +29,14 @@ from loguru import logger
 from social.core.exceptions import APIError, ConfigurationError
 from social.core.protocols import TokenProvider
 from social.platforms.google.constants import (
+    ACCOUNTS_CACHE_TTL_SECONDS,
     API_VERSION,
     COMPANY_ACCOUNT_MAP,
     DEFAULT_LOOKBACK_DAYS,
     GAQL_QUERIES,
+    MAX_QUERY_WORKERS,
+    QUERY_MAX_ATTEMPTS,
+    QUERY_RETRY_BASE_SECONDS,
 )
 from social.platforms.google.http_client import GoogleHTTPClient
 
@@ -86,6 +93,13 @@ class GoogleAdapter:
         self.manager_customer_id = manager_customer_id
         self.api_version = api_version
 
+        # Account hierarchy cache: (fetched_at, accounts) on the monotonic clock
+        self._accounts_cache: Optional[Tuple[float, pd.DataFrame]] = None
+        self._accounts_ttl = ACCOUNTS_CACHE_TTL_SECONDS
+
+        # Customer IDs skipped by the last run of each query label (failed after retries)
+        self.skipped_accounts: Dict[str, List[str]] = {}
+
         # Initialize HTTP client
         try:
             self.http_client = GoogleHTTPClient(
@@ -182,26 +196,11 @@ class GoogleAdapter:
             end_date.strftime("%Y-%m-%d"),
         )
 
-        for _, account in accounts.iterrows():
-            customer_id = str(account["id"])
-            account_name = account.get("descriptiveName", "Unknown")
-
-            logger.debug(f"Querying campaigns for account: {account_name} ({customer_id})")
-
-            try:
-                df = self.http_client.execute_query(
-                    customer_id=customer_id,
-                    query=query,
-                    use_streaming=True,
-                )
-
-                if not df.empty:
-                    all_data.append(df)
-                    logger.debug(f"Retrieved {len(df)} campaigns from {account_name}")
-
-            except Exception as e:
-                logger.warning(f"Failed to query account {customer_id}: {str(e)}")
-                continue
+        for _, account_name, df in self._query_accounts(
+            accounts, query, use_streaming=True, label="campaigns"
+        ):
+            all_data.append(df)
+            logger.debug(f"Retrieved {len(df)} campaigns from {account_name}")
 
         # Combine all results
         if all_data:
@@ -249,26 +248,11 @@ class GoogleAdapter:
 
         # Execute query for each account
         all_data = []
-        for _, account in accounts.iterrows():
-            customer_id = str(account["id"])
-            account_name = account.get("descriptiveName", "Unknown")
-
-            logger.debug(f"Querying ad report for account: {account_name} ({customer_id})")
-
-            try:
-                df = self.http_client.execute_query(
-                    customer_id=customer_id,
-                    query=query,
-                    use_streaming=True,
-                )
-
-                if not df.empty:
-                    all_data.append(df)
-                    logger.debug(f"Retrieved {len(df)} daily ad metrics from {account_name}")
-
-            except Exception as e:
-                logger.warning(f"Failed to query account {customer_id}: {str(e)}")
-                continue
+        for _, account_name, df in self._query_accounts(
+            accounts, query, use_streaming=True, label="ad report"
+        ):
+            all_data.append(df)
+            logger.debug(f"Retrieved {len(df)} daily ad metrics from {account_name}")
 
         # Combine all results
         if not all_data:
@@ -305,26 +289,11 @@ class GoogleAdapter:
         all_data = []
         query = GAQL_QUERIES["query_ads_ad_creatives"]
 
-        for _, account in accounts.iterrows():
-            customer_id = str(account["id"])
-            account_name = account.get("descriptiveName", "Unknown")
-
-            logger.debug(f"Querying ad creatives for account: {account_name} ({customer_id})")
-
-            try:
-                df = self.http_client.execute_query(
-                    customer_id=customer_id,
-                    query=query,
-                    use_streaming=True,
-                )
-
-                if not df.empty:
-                    all_data.append(df)
-                    logger.debug(f"Retrieved {len(df)} ad creatives from {account_name}")
-
-            except Exception as e:
-                logger.warning(f"Failed to query account {customer_id}: {str(e)}")
-                continue
+        for _, account_name, df in self._query_accounts(
+            accounts, query, use_streaming=True, label="ad creatives"
+        ):
+            all_data.append(df)
+            logger.debug(f"Retrieved {len(df)} ad creatives from {account_name}")
 
         # Combine all results
         if all_data:
@@ -392,41 +361,27 @@ class GoogleAdapter:
 
             query_total = 0
 
-            for _, account in accounts.iterrows():
-                customer_id = str(account["id"])
-                account_name = account.get("descriptiveName", "Unknown")
+            # Placements use regular request
+            for customer_id, account_name, df in self._query_accounts(
+                accounts, query, use_streaming=False, label=query_name
+            ):
+                all_data.append(df)
+                query_total += len(df)
 
-                logger.debug(f"Querying {query_name} for account: {account_name} ({customer_id})")
+                # Track per account
+                if customer_id not in total_rows_per_account:
+                    total_rows_per_account[customer_id] = 0
+                total_rows_per_account[customer_id] += len(df)
 
-                try:
-                    df = self.http_client.execute_query(
-                        customer_id=customer_id,
-                        query=query,
-                        use_streaming=False,  # Placements use regular request
-                    )
+                logger.warning(f"🔍 PLACEMENT DEBUG - {query_name} for account {account_name} ({customer_id}): {len(df)} placements")
 
-                    if not df.empty:
-                        all_data.append(df)
-                        query_total += len(df)
-
-                        # Track per account
-                        if customer_id not in total_rows_per_account:
-                            total_rows_per_account[customer_id] = 0
-                        total_rows_per_account[customer_id] += len(df)
-
-                        logger.warning(f"🔍 PLACEMENT DEBUG - {query_name} for account {account_name} ({customer_id}): {len(df)} placements")
-
-                        # Show unique ad_group.id count
-                        if 'ad_group.id' in df.columns:
-                            unique_ad_groups = df['ad_group.id'].nunique()
-                            logger.warning(f"   └─ Unique ad_groups: {unique_ad_groups}")
-                        elif 'id' in df.columns:
-                            unique_ad_groups = df['id'].nunique()
-                            logger.warning(f"   └─ Unique ad_groups (id column): {unique_ad_groups}")
-
-                except Exception as e:
-                    logger.warning(f"Failed to query account {customer_id}: {str(e)}")
-                    continue
+                # Show unique ad_group.id count
+                if 'ad_group.id' in df.columns:
+                    unique_ad_groups = df['ad_group.id'].nunique()
+                    logger.warning(f"   └─ Unique ad_groups: {unique_ad_groups}")
+                elif 'id' in df.columns:
+                    unique_ad_groups = df['id'].nunique()
+                    logger.warning(f"   └─ Unique ad_groups (id column): {unique_ad_groups}")
 
             total_rows_per_query[query_name] = query_total
             logger.warning(f"🔍 PLACEMENT DEBUG - {query_name} TOTAL: {query_total} placements")
@@ -465,12 +420,11 @@ class GoogleAdapter:
         logger.info("Fetching audiences for all customer accounts")
 
         # Get ALL customer accounts (not just enabled) - queries filter by campaign status
-        all_accounts = self.http_client.get_all_accounts()
-        if not all_accounts:
+        accounts = self._get_all_customer_accounts()
+        if accounts.empty:
             logger.warning("No customer accounts found")
             return pd.DataFrame()
 
-        accounts = pd.DataFrame(all_accounts)
         # Filter only non-manager accounts (but include all statuses)
         accounts = accounts[~accounts.get("manager", False)]
 
@@ -486,26 +440,12 @@ class GoogleAdapter:
         ]
 
         for query_name, query in queries:
-            for _, account in accounts.iterrows():
-                customer_id = str(account["id"])
-                account_name = account.get("descriptiveName", "Unknown")
-
-                logger.debug(f"Querying {query_name} for account: {account_name} ({customer_id})")
-
-                try:
-                    df = self.http_client.execute_query(
-                        customer_id=customer_id,
-                        query=query,
-                        use_streaming=False,  # Audiences use regular request
-                    )
-
-                    if not df.empty:
-                        all_data.append(df)
-                        logger.debug(f"Retrieved {len(df)} audiences from {account_name} ({query_name})")
-
-                except Exception as e:
-                    logger.warning(f"Failed to query account {customer_id}: {str(e)}")
-                    continue
+            # Audiences use regular request
+            for _, account_name, df in self._query_accounts(
+                accounts, query, use_streaming=False, label=query_name
+            ):
+                all_data.append(df)
+                logger.debug(f"Retrieved {len(df)} audiences from {account_name} ({query_name})")
 
         # Combine all results
         if all_data:
@@ -545,26 +485,12 @@ class GoogleAdapter:
         ]
 
         for query_name, query in queries:
-            for _, account in accounts.iterrows():
-                customer_id = str(account["id"])
-                account_name = account.get("descriptiveName", "Unknown")
-
-                logger.debug(f"Querying {query_name} for account: {account_name} ({customer_id})")
-
-                try:
-                    df = self.http_client.execute_query(
-                        customer_id=customer_id,
-                        query=query,
-                        use_streaming=False,  # Device data uses regular request
-                    )
-
-                    if not df.empty:
-                        all_data.append(df)
-                        logger.debug(f"Retrieved {len(df)} device records from {account_name} ({query_name})")
-
-                except Exception as e:
-                    logger.warning(f"Failed to query account {customer_id}: {str(e)}")
-                    continue
+            # Device data uses regular request
+            for _, account_name, df in self._query_accounts(
+                accounts, query, use_streaming=False, label=query_name
+            ):
+                all_data.append(df)
+                logger.debug(f"Retrieved {len(df)} device records from {account_name} ({query_name})")
 
         # Combine all results
         if all_data:
@@ -575,6 +501,115 @@ class GoogleAdapter:
             logger.warning("No device data retrieved")
             return pd.DataFrame()
 
+    def _query_one(
+        self,
+        customer_id: str,
+        account_name: str,
+        query: str,
+        use_streaming: bool,
+        label: str = "query",
+    ) -> Optional[pd.DataFrame]:
+        """
+        Execute a GAQL query for a single customer account.
+
+        Quota/rate-limit errors (RESOURCE_EXHAUSTED) are retried with a
+        jittered exponential backoff up to QUERY_MAX_ATTEMPTS times. Other
+        failures, or quota errors that persist, are logged and reported as
+        None so that one broken account does not abort the extraction for the
+        remaining accounts.
+
+        Args:
+            customer_id: Customer ID to query
+            account_name: Descriptive account name (for logging)
+            query: GAQL query string
+            use_streaming: Whether to use the streaming API
+            label: Query name used in log messages
+
+        Returns:
+            DataFrame with query results (empty if no rows), or None if the
+            query failed
+        """
+        logger.debug(f"Querying {label} for account: {account_name} ({customer_id})")
+
+        for attempt in range(1, QUERY_MAX_ATTEMPTS + 1):
+            try:
+                return self.http_client.execute_query(
+                    customer_id=customer_id,
+                    query=query,
+                    use_streaming=use_streaming,
+                )
+            except APIError as e:
+                if not e.details.get("quota_error") or attempt == QUERY_MAX_ATTEMPTS:
+                    logger.warning(f"Failed to query account {customer_id} ({label}): {str(e)}")
+                    return None
+
+                # Jittered backoff, so throttled workers don't retry in lockstep
+                delay = QUERY_RETRY_BASE_SECONDS * 2 ** (attempt - 1) * random.uniform(0.5, 1.5)
+                logger.warning(
+                    f"Quota exhausted for account {customer_id} ({label}), "
+                    f"retrying in {delay:.1f}s (attempt {attempt}/{QUERY_MAX_ATTEMPTS})"
+                )
+                time.sleep(delay)
+            except Exception as e:
+                logger.warning(f"Failed to query account {customer_id} ({label}): {str(e)}")
+                return None
+
+        return None
+
+    def _query_accounts(
+        self,
+        accounts: pd.DataFrame,
+        query: str,
+        use_streaming: bool,
+        label: str = "query",
+    ) -> List[Tuple[str, str, pd.DataFrame]]:
+        """
+        Execute a GAQL query for every account concurrently.
+
+        Queries are I/O bound, so they are dispatched on a thread pool of at
+        most MAX_QUERY_WORKERS threads. Results are returned in account order.
+        Accounts whose query failed are recorded in ``skipped_accounts[label]``.
+
+        Args:
+            accounts: DataFrame of customer accounts (``id``, ``descriptiveName``)
+            query: GAQL query string
+            use_streaming: Whether to use the streaming API
+            label: Query name used in log messages
+
+        Returns:
+            List of (customer_id, account_name, DataFrame) for accounts that
+            returned data
+        """
+        if accounts.empty:
+            self.skipped_accounts[label] = []
+            return []
+
+        # Plain column lists avoid building a Series/namedtuple per account
+        customer_ids = accounts["id"].astype(str).tolist()
+        if "descriptiveName" in accounts.columns:
+            account_names = accounts["descriptiveName"].fillna("Unknown").tolist()
+        else:
+            account_names = ["Unknown"] * len(customer_ids)
+        tasks = list(zip(customer_ids, account_names))
+
+        with ThreadPoolExecutor(max_workers=min(MAX_QUERY_WORKERS, len(tasks))) as executor:
+            futures = [
+                executor.submit(self._query_one, customer_id, account_name, query, use_streaming, label)
+                for customer_id, account_name in tasks
+            ]
+            results = [future.result() for future in futures]
+
+        skipped = [customer_id for (customer_id, _), df in zip(tasks, results) if df is None]
+        self.skipped_accounts[label] = skipped
+        if skipped:
+            logger.warning(f"Skipped {len(skipped)}/{len(tasks)} accounts for {label}: {skipped}")
+
+        return [
+            (customer_id, account_name, df)
+            for (customer_id, account_name), df in zip(tasks, results)
+            if df is not None and not df.empty
+        ]
+
     def _get_enabled_customer_accounts(self) -> pd.DataFrame:
         """
         Get all enabled non-manager customer accounts.
@@ -586,12 +621,10 @@ class GoogleAdapter:
             APIError: If account retrieval fails
         """
         try:
-            all_accounts = self.http_client.get_all_accounts()
+            df = self._get_all_customer_accounts()
 
-            if not all_accounts:
-                return pd.DataFrame()
-
-            df = pd.DataFrame(all_accounts)
+            if df.empty:
+                return df
 
             # Filter: non-manager + enabled status
             enabled = df[
@@ -609,10 +642,40 @@ class GoogleAdapter:
                 details={"manager_id": self.manager_customer_id},
             )
 
+    def _get_all_customer_accounts(self) -> pd.DataFrame:
+        """
+        Get all customer accounts under the manager, cached for a short TTL.
+
+        Walking the MCC hierarchy costs several API round-trips, and every
+        get_all_* method needs the account list, so the result is reused for
+        ``_accounts_ttl`` seconds.
+
+        Returns:
+            DataFrame with all customer accounts (empty if none)
+        """
+        if (
+            self._accounts_cache is not None
+            and time.monotonic() - self._accounts_cache[0] < self._accounts_ttl
+        ):
+            return self._accounts_cache[1]
+
+        all_accounts = self.http_client.get_all_accounts()
+        df = pd.DataFrame(all_accounts) if all_accounts else pd.DataFrame()
+
+        self._accounts_cache = (time.monotonic(), df)
+        return df
+
+    def invalidate_accounts_cache(self) -> None:
+        """
+        Drop the cached account hierarchy so the next call refetches it.
+        """
+        self._accounts_cache = None
+
     def close(self) -> None:
         """
         Close the adapter and release resources.
         """
+        self.invalidate_accounts_cache()
         if self.http_client:
             self.http_client.close()
         logger.debug("Google Ads adapter closed")
@@ -29,6 +29,10 @@ COMPANY_ACCOUNT_MAP: Dict[str, int] = {
 API_VERSION: str = "v23"
 DEFAULT_LOOKBACK_DAYS: int = 150
 MICROS_DIVISOR: int = 1_000_000  # Google Ads costs are in micros (1/1,000,000 of currency)
+MAX_QUERY_WORKERS: int = 8  # Upper bound on concurrent per-account GAQL queries
+QUERY_MAX_ATTEMPTS: int = 4  # Attempts per account query when Google Ads reports quota exhaustion
+QUERY_RETRY_BASE_SECONDS: int = 5  # First backoff after a quota error (doubles per attempt, jittered)
+ACCOUNTS_CACHE_TTL_SECONDS: int = 300  # How long the MCC account hierarchy is reused
 
 # ============================================================================
 # GAQL Query Templates
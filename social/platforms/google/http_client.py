@@ -264,9 +264,40 @@ class GoogleHTTPClient:
                     "customer_id": customer_id,
                     "query": query[:200] if len(query) > 200 else query,
                     "use_streaming": use_streaming,
+                    "quota_error": self._is_quota_error(e),
                 },
             )
 
+    @staticmethod
+    def _is_quota_error(error: Exception) -> bool:
+        """
+        Check whether a failed request hit a Google Ads quota or rate limit.
+
+        GoogleAdsException carries a GoogleAdsFailure whose errors may hold a
+        quota_error code; raw gRPC errors report RESOURCE_EXHAUSTED.
+
+        Args:
+            error: Exception raised by the Google Ads client
+
+        Returns:
+            True for quota/rate-limit errors that are worth retrying later
+        """
+        failure = getattr(error, "failure", None)
+        for failure_error in getattr(failure, "errors", None) or []:
+            if failure_error.error_code.WhichOneof("error_code") == "quota_error":
+                return True
+
+        # GoogleAdsException wraps the gRPC call in .error; gRPC errors expose code()
+        call = getattr(error, "error", None) or error
+        code = getattr(call, "code", None)
+        if callable(code):
+            try:
+                return getattr(code(), "name", None) == "RESOURCE_EXHAUSTED"
+            except Exception:
+                return False
+
+        return False
+
     def _convert_streaming_response_to_df(
         self,
         response: _StreamingResponseIterator,
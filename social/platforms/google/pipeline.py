@@ -165,8 +165,18 @@ class GooglePipeline:
 
             # Extract data
             logger.info(f"Extracting data for {table_name}")
+            self.adapter.skipped_accounts.clear()
             df = self._extract_table(table_name, table_config, start_date, end_date)
 
+            # Accounts whose queries failed (after quota retries) are missing from this load
+            skipped_accounts = sorted({
+                customer_id
+                for customer_ids in self.adapter.skipped_accounts.values()
+                for customer_id in customer_ids
+            })
+            if skipped_accounts:
+                logger.warning(f"{table_name}: {len(skipped_accounts)} accounts skipped: {skipped_accounts}")
+
             if df.empty:
                 logger.warning(f"No data extracted for {table_name}")
                 empty_stats = {
@@ -176,6 +186,7 @@ class GooglePipeline:
                     "rows_skipped": 0,
                     "rows_filtered": 0,
                     "rows_written": 0,
+                    "accounts_skipped": len(skipped_accounts),
                 }
                 return df, empty_stats
 
@@ -215,6 +226,7 @@ class GooglePipeline:
             if load_to_sink and self.data_sink is not None:
                 logger.info(f"Loading data to sink: {table_name}")
                 stats = self._load_to_sink(processed_df, table_name, table_config)
+                stats["accounts_skipped"] = len(skipped_accounts)
                 logger.success(
                     f"Loaded {stats['rows_written']} rows to {table_name} "
                     f"({stats['rows_inserted']} new + {stats['rows_updated']} updated)"
@@ -321,6 +333,12 @@ class GooglePipeline:
         if errors:
             logger.warning(f"Failed tables: {list(errors.keys())}")
 
+        partial_tables = [
+            name for name, stats in results_stats.items() if stats and stats.get("accounts_skipped")
+        ]
+        if partial_tables:
+            logger.warning(f"Tables loaded without some accounts: {partial_tables}")
+
         return results_stats, errors
 
     def _extract_table(
@@ -440,7 +458,8 @@ class GooglePipeline:
         else:
             # OLD APPROACH: Use legacy GoogleProcessor with dynamic methods
             logger.debug(f"Using legacy GoogleProcessor for {table_name}")
-            processor = GoogleProcessor(df)
+            # The extracted frame is not used after processing: steps can work on it in place
+            processor = GoogleProcessor(df, copy=False)
 
             # Apply processing steps from configuration
             processing_config = table_config.get("processing", {})
@@ -33,6 +33,22 @@ from social.platforms.google.constants import (
 )
 from social.utils.aggregation import aggregate_metrics_by_entity
 
+# Compiled once; used per value by _remove_emojis and per column by modify_name
+_EMOJI_RE = re.compile(
+    "["
+    "\U0001F600-\U0001F64F"  # emoticons
+    "\U0001F300-\U0001F5FF"  # symbols & pictographs
+    "\U0001F680-\U0001F6FF"  # transport & map symbols
+    "\U0001F1E0-\U0001F1FF"  # flags (iOS)
+    "\U00002702-\U000027B0"
+    "\U000024C2-\U0001F251"
+    "]+",
+    flags=re.UNICODE,
+)
+
+# Anything but Latin letters, digits, whitespace and common punctuation
+_NON_LATIN_RE = re.compile(r'[^a-zA-Z0-9\s\-.,;:!?()\[\]\'"]+')
+
 
 class GoogleProcessor:
     """
@@ -61,14 +77,16 @@ class GoogleProcessor:
         df: DataFrame being processed
     """
 
-    def __init__(self, df: pd.DataFrame) -> None:
+    def __init__(self, df: pd.DataFrame, copy: bool = True) -> None:
         """
         Initialize processor with DataFrame.
 
         Args:
             df: DataFrame to process
+            copy: Work on a copy of df; False lets steps modify a frame the
+                caller no longer needs instead of copying it first
         """
-        self.df = df.copy()  # Work on a copy to avoid side effects
+        self.df = df.copy() if copy else df
 
     def handle_columns(self) -> "GoogleProcessor":
         """
@@ -256,9 +274,13 @@ class GoogleProcessor:
             return self
 
         try:
-            self.df["companyid"] = self.df[account_column].apply(
-                lambda x: COMPANY_ACCOUNT_MAP.get(str(x), 1)  # Default to company 1
-            )
+            # Resolve each distinct account once, then map the column in a single pass
+            accounts = self.df[account_column]
+            company_by_account = {
+                account: COMPANY_ACCOUNT_MAP.get(str(account), 1)  # Default to company 1
+                for account in accounts.unique()
+            }
+            self.df["companyid"] = accounts.map(company_by_account)
             logger.debug(f"Added company IDs for {len(self.df)} rows")
         except Exception as e:
             logger.error(f"Failed to add company IDs: {e}")
@@ -292,6 +314,8 @@ class GoogleProcessor:
         if self.df.empty:
             return self
 
+        # Plain date values: every sink (Vertica DATE cast, Azure Table str(date))
+        # expects a date, not a midnight timestamp
         self.df["load_date"] = datetime.now().date()
         logger.debug("Added load_date column")
 
@@ -315,17 +339,14 @@ class GoogleProcessor:
         for col in columns:
             if col in self.df.columns:
                 try:
-                    if self.df[col].dtype == object:  # String column
-                        # Remove emoji
-                        self.df[col] = self.df[col].apply(
-                            lambda x: self._remove_emojis(str(x)) if pd.notna(x) else x
-                        )
-                        # Remove non-latin
-                        self.df[col] = self.df[col].apply(
-                            lambda x: self._keep_latin_only(str(x)) if pd.notna(x) else x
+                    if pd.api.types.is_string_dtype(self.df[col]):  # String column (object or str dtype)
+                        # Remove emoji, non-latin characters and pipes on the whole column
+                        self.df[col] = (
+                            self.df[col]
+                            .str.replace(_EMOJI_RE, "", regex=True)
+                            .str.replace(_NON_LATIN_RE, "", regex=True)
+                            .str.replace("|", "-", regex=False)
                         )
-                        # Remove pipes
-                        self.df[col] = self.df[col].str.replace("|", "-", regex=False)
 
                         logger.debug(f"Cleaned name column '{col}'")
                 except Exception as e:
@@ -908,18 +929,7 @@ class GoogleProcessor:
         Returns:
             Text with emojis removed
         """
-        emoji_pattern = re.compile(
-            "["
-            "\U0001F600-\U0001F64F"  # emoticons
-            "\U0001F300-\U0001F5FF"  # symbols & pictographs
-            "\U0001F680-\U0001F6FF"  # transport & map symbols
-            "\U0001F1E0-\U0001F1FF"  # flags (iOS)
-            "\U00002702-\U000027B0"
-            "\U000024C2-\U0001F251"
-            "]+",
-            flags=re.UNICODE,
-        )
-        return emoji_pattern.sub(r"", text)
+        return _EMOJI_RE.sub(r"", text)
 
     @staticmethod
     def _keep_latin_only(text: str) -> str:
@@ -932,7 +942,7 @@ class GoogleProcessor:
         Returns:
             Text with only Latin characters
         """
-        return re.sub(r'[^a-zA-Z0-9\s\-.,;:!?()\[\]\'"]+', "", text)
+        return _NON_LATIN_RE.sub("", text)
 
     def aggregate_by_entity(
         self,
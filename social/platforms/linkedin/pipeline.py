@@ -587,8 +587,9 @@ class LinkedInPipeline:
         if df.empty:
             return df
 
-        # Create processor with adapter for lookups
-        processor = LinkedInProcessor(df, adapter=self.adapter)
+        # Create processor with adapter for lookups; the extracted frame is
+        # not used after processing, so steps can work on it in place
+        processor = LinkedInProcessor(df, adapter=self.adapter, copy=False)
 
         # Apply processing steps from configuration
         processing_config = table_config.get("processing", {})
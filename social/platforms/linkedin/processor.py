@@ -26,6 +26,19 @@ from loguru import logger
 from social.platforms.linkedin.constants import COMPANY_ACCOUNT_MAP
 from social.utils.aggregation import aggregate_metrics_by_entity
 
+# Compiled once; applied column-wide by modify_name
+_EMOJI_RE = re.compile(
+    "["
+    "\U0001F600-\U0001F64F"  # emoticons
+    "\U0001F300-\U0001F5FF"  # symbols & pictographs
+    "\U0001F680-\U0001F6FF"  # transport & map symbols
+    "\U0001F1E0-\U0001F1FF"  # flags (iOS)
+    "\U00002702-\U000027B0"
+    "\U000024C2-\U0001F251"
+    "]+",
+    flags=re.UNICODE
+)
+
 
 class LinkedInProcessor:
     """Chainable data processor for LinkedIn Ads data.
@@ -45,14 +58,19 @@ class LinkedInProcessor:
         df: The DataFrame being processed
     """
 
-    def __init__(self, df: pd.DataFrame, adapter=None):
+    def __init__(self, df: pd.DataFrame, adapter=None, copy: bool = True):
         """Initialize processor with a DataFrame and optional adapter.
 
         Args:
             df: Raw DataFrame from API response
             adapter: LinkedInAdapter for API lookups (optional)
+            copy: Work on a copy of df; False lets steps modify a frame the
+                caller no longer needs instead of copying it first
         """
-        self.df = df.copy() if not df.empty else pd.DataFrame()
+        if df.empty:
+            self.df = pd.DataFrame()
+        else:
+            self.df = df.copy() if copy else df
         self.adapter = adapter
         logger.debug(f"LinkedInProcessor initialized with {len(self.df)} rows")
 
@@ -233,10 +251,13 @@ class LinkedInProcessor:
             logger.warning(f"Account column '{account_column}' not found, skipping company mapping")
             return self
 
-        # Map account IDs to company IDs
-        self.df["companyid"] = self.df[account_column].apply(
-            lambda x: COMPANY_ACCOUNT_MAP.get(str(x), 1)  # Default to 1 if not found
-        )
+        # Resolve each distinct account once, then map the column in a single pass
+        accounts = self.df[account_column]
+        company_by_account = {
+            account: COMPANY_ACCOUNT_MAP.get(str(account), 1)  # Default to 1 if not found
+            for account in accounts.unique()
+        }
+        self.df["companyid"] = accounts.map(company_by_account)
 
         logger.debug(f"Added company IDs for {len(self.df)} rows")
         return self
@@ -250,6 +271,8 @@ class LinkedInProcessor:
         if self.df.empty:
             return self
 
+        # Plain date values: every sink (Vertica DATE cast, Azure Table str(date))
+        # expects a date, not a midnight timestamp
         today = datetime.now().date()
         self.df["load_date"] = today
         logger.debug("Added load_date column")
@@ -279,13 +302,13 @@ class LinkedInProcessor:
                 logger.warning(f"Column '{col}' not found, skipping name modification")
                 continue
 
-            if self.df[col].dtype == object:  # String column
+            if pd.api.types.is_string_dtype(self.df[col]):  # String column (object or str dtype)
                 # Replace pipe characters (used as delimiter in COPY statements)
-                self.df[col] = self.df[col].str.replace("|", "-", regex=False)
-
-                # Remove emojis using deEmojify logic
-                self.df[col] = self.df[col].apply(
-                    lambda x: self._remove_emoji(str(x)) if pd.notna(x) else x
+                # and remove emojis, both on the whole column
+                self.df[col] = (
+                    self.df[col]
+                    .str.replace("|", "-", regex=False)
+                    .str.replace(_EMOJI_RE, "", regex=True)
                 )
 
         logger.debug(f"Modified name columns: {columns}")
@@ -439,29 +462,6 @@ class LinkedInProcessor:
         logger.debug("Modified account URN column")
         return self
 
-    @staticmethod
-    def _remove_emoji(text: str) -> str:
-        """Remove emoji characters from text.
-
-        Args:
-            text: Input text
-
-        Returns:
-            Text with emojis removed
-        """
-        emoji_pattern = re.compile(
-            "["
-            "\U0001F600-\U0001F64F"  # emoticons
-            "\U0001F300-\U0001F5FF"  # symbols & pictographs
-            "\U0001F680-\U0001F6FF"  # transport & map symbols
-            "\U0001F1E0-\U0001F1FF"  # flags (iOS)
-            "\U00002702-\U000027B0"
-            "\U000024C2-\U0001F251"
-            "]+",
-            flags=re.UNICODE
-        )
-        return emoji_pattern.sub(r'', text)
-
     def aggregate_by_entity(
         self,
         group_columns: List[str] = None,
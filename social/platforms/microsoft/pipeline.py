@@ -180,7 +180,8 @@ class MicrosoftAdsPipeline:
 
             # Process the data
             logger.info("Processing data")
-            processor = MicrosoftAdsProcessor(df)
+            # The report frame is not used after processing: steps can work on it in place
+            processor = MicrosoftAdsProcessor(df, copy=False)
 
             # Apply processing steps from config
             if table_config.processing_steps:
@@ -43,12 +43,14 @@ class MicrosoftAdsProcessor:
         df (pd.DataFrame): The DataFrame being processed
     """
 
-    def __init__(self, df: pd.DataFrame):
+    def __init__(self, df: pd.DataFrame, copy: bool = True):
         """
         Initialize the processor with a DataFrame.
 
         Args:
             df: DataFrame to process (typically from MicrosoftAdsClient)
+            copy: Work on a copy of df; False lets steps modify a frame the
+                caller no longer needs instead of copying it first
 
         Raises:
             ValueError: If df is None or empty
@@ -59,7 +61,7 @@ class MicrosoftAdsProcessor:
         if df.empty:
             logger.warning("Initializing processor with empty DataFrame")
 
-        self.df = df.copy()  # Work with a copy to avoid side effects
+        self.df = df.copy() if copy else df
         logger.debug(f"MicrosoftAdsProcessor initialized with {len(self.df)} rows")
 
     def add_row_loaded_date(self, column_name: str = "row_loaded_date") -> "MicrosoftAdsProcessor":
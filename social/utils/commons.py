@@ -7,13 +7,13 @@ import re
 import sys
 import time
 from datetime import datetime, timedelta
-from typing import Any, AnyStr, Callable, Dict, List, Tuple, Union
+from typing import Any, AnyStr, Callable, Dict, Iterator, List, Tuple, Union
 
 import emoji
 import joblib
 import pandas as pd
 from loguru import logger
-from requests import Response
+from requests import RequestException, Response
 
 
 def find_between(s, first, last):
@@ -130,6 +130,10 @@ def retrybackoffexp(fun, *args, **kwargs):
     """
     Retry decorator with exponential backoff.
 
+    Only network errors are retried; any other exception is raised
+    immediately, so it should decorate request functions, not data
+    transformations.
+
     Args:
         fun: Function to retry
 
@@ -142,7 +146,7 @@ def retrybackoffexp(fun, *args, **kwargs):
         for tries in range(1, max_tries):
             try:
                 return fun(*args, **kwargs)
-            except Exception as e:
+            except (RequestException, ConnectionError, TimeoutError) as e:
                 logger.warning(f"Request failed: {e}")
                 logger.info(f"Retrying in {n_sec**(tries+1)} seconds")
                 time.sleep(n_sec ** (tries + 1))
@@ -151,10 +155,36 @@ def retrybackoffexp(fun, *args, **kwargs):
     return wrapper
 
 
+# Emoji and pictograph code points, compiled once for per-value and whole-column use
+# (e.g. ``series.str.replace(EMOJI_RE, "", regex=True)``)
+EMOJI_RE = re.compile(
+    "["
+    "\U0001F600-\U0001F64F"
+    "\U0001F300-\U0001F5FF"
+    "\U0001F680-\U0001F6FF"
+    "\U0001F1E0-\U0001F1FF"
+    "\U00002500-\U00002BEF"
+    "\U00002702-\U000027B0"
+    "\U000024C2-\U0001F251"
+    "\U0001f926-\U0001f937"
+    "\U00010000-\U0010ffff"
+    "\u2640-\u2642"
+    "\u2600-\u2B55"
+    "\u200d"
+    "\u23cf"
+    "\u23e9"
+    "\u231a"
+    "\ufe0f"
+    "\u3030"
+    "]+",
+    re.UNICODE,
+)
+
+
 def deEmojify(text: str) -> str:
     """Remove emojis from text."""
     try:
-        return "".join(c for c in text if c not in emoji.UNICODE_EMOJI)
+        return emoji.replace_emoji(text, replace="")
     except TypeError:
         logger.debug("NaN found when stripping emoji")
         return text
@@ -162,29 +192,7 @@ def deEmojify(text: str) -> str:
 
 def remove_emojis(data: str) -> str:
     """Remove emoji characters using regex."""
-    emoj = re.compile(
-        "["
-        "\U0001F600-\U0001F64F"
-        "\U0001F300-\U0001F5FF"
-        "\U0001F680-\U0001F6FF"
-        "\U0001F1E0-\U0001F1FF"
-        "\U00002500-\U00002BEF"
-        "\U00002702-\U000027B0"
-        "\U000024C2-\U0001F251"
-        "\U0001f926-\U0001f937"
-        "\U00010000-\U0010ffff"
-        "\u2640-\u2642"
-        "\u2600-\u2B55"
-        "\u200d"
-        "\u23cf"
-        "\u23e9"
-        "\u231a"
-        "\ufe0f"
-        "\u3030"
-        "]+",
-        re.UNICODE,
-    )
-    return re.sub(emoj, "", data)
+    return EMOJI_RE.sub("", data)
 
 
 def fix_id_type(df: pd.DataFrame) -> pd.DataFrame:
@@ -264,23 +272,6 @@ def handle_nested_response(alist: List, nested_element: List) -> pd.DataFrame:
     return pd.DataFrame(dict([(k, pd.Series(v)) for k, v in outputdict.items()]))
 
 
-def handle_simple_response(response: Union[dict, List]) -> pd.DataFrame:
-    """Handle simple (non-nested) response."""
-    if isinstance(response, List):
-        dfs = []
-        for idx, r in enumerate(response):
-            try:
-                dfs.append(pd.DataFrame(r))
-            except ValueError:
-                dfs.append(pd.DataFrame(r, index=[idx]))
-        return pd.concat(dfs)
-    else:
-        try:
-            return pd.DataFrame(response)
-        except ValueError:
-            return pd.DataFrame(response, index=[0])
-
-
 def get_range_dates(days: int) -> Tuple[str, str]:
     """Get date range as strings."""
     if not isinstance(days, int):
@@ -381,16 +372,33 @@ def handle_nested_response(alist: List, nested_element: List) -> pd.DataFrame:
     return pd.DataFrame(dict([(k, pd.Series(v)) for k, v in outputdict.items()]))
 
 
-def handle_simple_response(response: Union[dict, List]) -> pd.DataFrame:
-    """Handle simple (non-nested) response by converting directly to DataFrame."""
-    if isinstance(response, List):
-        dfs = []
-        for idx, r in enumerate(response):
+def _iter_response_records(response: List) -> Iterator[dict]:
+    """Flatten a list response into row dictionaries.
+
+    Flat dicts become one row, lists of dicts are expanded in place, and
+    column-oriented dicts (list values) are expanded the same way
+    pd.DataFrame would do it.
+    """
+    for idx, r in enumerate(response):
+        if isinstance(r, dict) and not any(isinstance(v, (list, dict)) for v in r.values()):
+            yield r
+        elif isinstance(r, list) and all(isinstance(x, dict) for x in r):
+            yield from r
+        else:
             try:
-                dfs.append(pd.DataFrame(r))
+                yield from pd.DataFrame(r).to_dict("records")
             except ValueError:
-                dfs.append(pd.DataFrame(r, index=[idx]))
-        return pd.concat(dfs, ignore_index=True)
+                yield from pd.DataFrame(r, index=[idx]).to_dict("records")
+
+
+def handle_simple_response(response: Union[dict, List]) -> pd.DataFrame:
+    """Handle simple (non-nested) response by converting directly to DataFrame.
+
+    List responses are flattened into records and built with a single
+    DataFrame constructor instead of one DataFrame per element plus concat.
+    """
+    if isinstance(response, List):
+        return pd.DataFrame.from_records(list(_iter_response_records(response)))
     else:
         try:
             return pd.DataFrame(response)
@@ -398,6 +406,73 @@ def handle_simple_response(response: Union[dict, List]) -> pd.DataFrame:
             return pd.DataFrame(response, index=[0])
 
 
+def records_to_dataframe(records: List[Dict[str, Any]]) -> pd.DataFrame:
+    """Build a DataFrame from a list of API records.
+
+    When polars is installed the frame is assembled with its multi-threaded
+    constructor and converted to pandas at the end; nested values (lists,
+    dicts) are copied over unchanged so downstream processing sees the same
+    Python objects as with ``pd.DataFrame(records)``, which is also the
+    fallback when polars is missing or cannot infer a schema.
+    """
+    if not records:
+        return pd.DataFrame()
+
+    try:
+        import polars as pl
+    except ImportError:
+        return pd.DataFrame(records)
+
+    try:
+        pl_df = pl.DataFrame(records, infer_schema_length=None)
+        nested_cols = [
+            name for name, dtype in pl_df.schema.items() if dtype.is_nested()
+        ]
+        df = pl_df.drop(nested_cols).to_pandas()
+    except Exception as e:
+        logger.debug(f"Polars conversion failed, using pandas: {e}")
+        return pd.DataFrame(records)
+
+    for col in nested_cols:
+        df[col] = pd.Series([record.get(col) for record in records], dtype=object)
+
+    return df[pl_df.columns]
+
+
+def combine_arrow_chunks(df: pd.DataFrame) -> pd.DataFrame:
+    """Rechunk pyarrow-backed columns into a single contiguous chunk.
+
+    ``pd.concat`` of arrow-backed frames keeps one chunk per source frame,
+    which makes later string kernels run chunk by chunk. Columns that are
+    not arrow-backed, or already have a single chunk, are left untouched.
+    """
+    for col in df.columns:
+        values = df[col].array
+        pa_array = getattr(values, "_pa_array", None)
+        if pa_array is not None and pa_array.num_chunks > 1:
+            df[col] = pd.array(pa_array.combine_chunks(), dtype=values.dtype)
+    return df
+
+
+def to_arrow_strings(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert object columns holding only strings to ``string[pyarrow]``.
+
+    Arrow strings are stored in contiguous UTF-8 buffers instead of one
+    Python object per cell, and ``.str`` methods run on Arrow kernels.
+    Columns with nested values (lists, dicts) or mixed types stay object.
+    Without pyarrow the frame is returned unchanged.
+    """
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return df
+
+    for col in df.columns:
+        if df[col].dtype == object and pd.api.types.infer_dtype(df[col], skipna=True) == "string":
+            df[col] = df[col].astype("string[pyarrow]")
+    return df
+
+
 def extract_targeting_criteria(campaigns: List[Dict]) -> pd.DataFrame:
     """
     Extract audience_id rows from LinkedIn campaign targetingCriteria.
@@ -0,0 +1,133 @@
+"""Tests for FacebookHTTPClient failure isolation (no network access)."""
+
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from social.platforms.facebook import http_client as http_client_module
+from social.platforms.facebook.http_client import FacebookHTTPClient
+
+
+class FakeReportRun:
+    """AdReportRun stand-in: fixed status, rows or errors."""
+
+    def __init__(self, report_id, status="Job Completed", rows=None, poll_error=None, read_error=None):
+        self.report_id = report_id
+        self.status = status
+        self.rows = rows or []
+        self.poll_error = poll_error
+        self.read_error = read_error
+
+    def get_id(self):
+        return self.report_id
+
+    def api_get(self, fields=None):
+        if self.poll_error:
+            raise self.poll_error
+        return {"async_status": self.status, "async_percent_completion": 100}
+
+    def get_insights(self, params=None):
+        if self.read_error:
+            raise self.read_error
+        return list(self.rows)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(http_client_module.time, "sleep", lambda seconds: None)
+    token_provider = MagicMock()
+    token_provider.get_access_token.return_value = "test-token"
+    return FacebookHTTPClient(token_provider, app_id="test-app", app_secret="secret")
+
+
+def _chunked(client, account_id, report_runs):
+    account = MagicMock()
+    account.get_id.return_value = account_id
+    account.get_insights.side_effect = report_runs
+    client.get_ad_account = MagicMock(return_value=account)
+
+    return client.get_insights_chunked(
+        account_id,
+        fields=["spend"],
+        start_date=datetime(2024, 1, 1),
+        end_date=datetime(2024, 5, 31),
+        chunk_days=30,
+    )
+
+
+def test_chunked_insights_skip_only_failed_chunks(client):
+    report_runs = [
+        FakeReportRun("ok-1", rows=[{"spend": "1"}]),
+        FakeReportRun("poll-error", poll_error=RuntimeError("permission denied")),
+        FakeReportRun("job-failed", status="Job Failed"),
+        FakeReportRun("read-error", read_error=RuntimeError("page 2 failed")),
+        FakeReportRun("ok-2", rows=[{"spend": "2"}, {"spend": "3"}]),
+    ]
+
+    insights = _chunked(client, "act_isolation", report_runs)
+
+    assert insights == [{"spend": "1"}, {"spend": "2"}, {"spend": "3"}]
+
+
+def test_single_report_wait_raises_on_status_check_error(client):
+    report_run = FakeReportRun("poll-error", poll_error=RuntimeError("permission denied"))
+
+    with pytest.raises(http_client_module.APIError):
+        client._wait_for_report(report_run)
+
+
+class FakeBatch:
+    """FacebookAdsApiBatch stand-in that answers every sub-request at once."""
+
+    def __init__(self, bodies):
+        self.bodies = bodies
+        self.callbacks = []
+
+    def add_request(self, request, success=None, failure=None):
+        self.callbacks.append((request, success))
+
+    def execute(self):
+        for request, success in self.callbacks:
+            response = MagicMock()
+            response.json.return_value = self.bodies[request]
+            success(response)
+        return None
+
+
+def test_batch_page_failure_only_fails_its_key(client):
+    bodies = {
+        "req-a": {"data": [{"id": "1"}], "paging": {"next": "https://graph/next-a"}},
+        "req-b": {"data": [{"id": "2"}], "paging": {"next": "https://graph/next-b"}},
+        "req-c": {"data": [{"id": "3"}]},
+    }
+
+    def call(method, url):
+        if url.endswith("next-b"):
+            raise RuntimeError("page failed")
+        response = MagicMock()
+        response.json.return_value = {"data": [{"id": "1b"}]}
+        return response
+
+    client.api = MagicMock()
+    client.api.new_batch.return_value = FakeBatch(bodies)
+    client.api.call.side_effect = call
+
+    results, errors = client.execute_batch({"a": "req-a", "b": "req-b", "c": "req-c"})
+
+    assert results == {"a": [{"id": "1"}, {"id": "1b"}], "c": [{"id": "3"}]}
+    assert list(errors) == ["b"]
+
+
+@pytest.mark.parametrize(
+    "error, expected",
+    [
+        (ValueError("too many values to unpack"), False),
+        (KeyError("rate limit"), False),
+        (http_client_module.APIError("There have been too many calls from this ad-account"), True),
+        (http_client_module.APIError("API call failed", details={"error_code": 17}), True),
+        (http_client_module.APIError("API call failed", details={"error_code": 100}), False),
+    ],
+)
+def test_is_rate_limit_only_for_api_errors(error, expected):
+    assert FacebookHTTPClient._is_rate_limit(error) is expected
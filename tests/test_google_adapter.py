@@ -0,0 +1,56 @@
+"""Tests for GoogleAdapter per-account query handling (no network access)."""
+
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("google.ads.googleads")
+
+from social.core.exceptions import APIError  # noqa: E402
+from social.platforms.google import adapter as adapter_module  # noqa: E402
+
+
+class FakeHTTPClient:
+    """GoogleHTTPClient stand-in: per-account quota errors and failures."""
+
+    def __init__(self, **kwargs):
+        self.quota_failures = {"2": 2}
+        self.calls = []
+
+    def get_all_accounts(self):
+        return [
+            {"id": customer_id, "descriptiveName": f"account {customer_id}", "manager": False, "status": "ENABLED"}
+            for customer_id in ("1", "2", "3", "4")
+        ]
+
+    def execute_query(self, customer_id, query, use_streaming=False):
+        self.calls.append(customer_id)
+        if self.quota_failures.get(customer_id):
+            self.quota_failures[customer_id] -= 1
+            raise APIError("RESOURCE_EXHAUSTED", details={"quota_error": True})
+        if customer_id == "3":
+            raise APIError("PERMISSION_DENIED", details={"quota_error": False})
+        if customer_id == "4":
+            return pd.DataFrame()
+        return pd.DataFrame({"customer_id": [customer_id]})
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def adapter(monkeypatch):
+    monkeypatch.setattr(adapter_module, "GoogleHTTPClient", FakeHTTPClient)
+    monkeypatch.setattr(adapter_module.time, "sleep", lambda seconds: None)
+    return adapter_module.GoogleAdapter(token_provider=MagicMock(), config_file_path="google-ads.yaml")
+
+
+def test_quota_errors_are_retried_and_failures_reported(adapter):
+    df = adapter.get_all_ad_creatives()
+
+    # Account 2 succeeds after two quota errors; account 3 fails; account 4 is empty
+    assert df["customer_id"].tolist() == ["1", "2"]
+    assert adapter.http_client.calls.count("2") == 3
+    assert adapter.http_client.calls.count("3") == 1
+    assert adapter.skipped_accounts == {"ad creatives": ["3"]}